@@ -0,0 +1,118 @@
+"""
+File: _eval_jit.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: Numba-compiled Monte Carlo equity estimates, scoring card ints
+             (playingCard.code) with the Cactus Kev seven-card lookup tables.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from deck import BIT_CODES
+from hand_evaluator import FLUSH7_LOOKUP_ARRAY, UNSUITED7_KEYS, UNSUITED7_RANKS
+
+# Card int of each bit of a 52-bit card set (playingCard.bit).
+_DECK_CODES = np.array(BIT_CODES, dtype=np.int64)
+
+
+@njit(cache=True)
+def evaluate7(codes: np.ndarray) -> int:
+   """
+   Score the best 5-card hand within 5-7 card ints with the seven-card lookup tables.
+
+   Returns:
+      int: Cactus Kev rank of the best 5-card hand (lower is stronger).
+   """
+   product = 1
+   suitMasks = np.zeros(4, dtype=np.int64)
+   suitCounts = np.zeros(4, dtype=np.int64)
+   for i in range(codes.shape[0]):
+      code = codes[i]
+      product *= code & 0xFF
+      suit = 0
+      while not (code >> (12 + suit)) & 1:
+         suit += 1
+      suitMasks[suit] |= code >> 16
+      suitCounts[suit] += 1
+   for suit in range(4):
+      if suitCounts[suit] >= 5:
+         return FLUSH7_LOOKUP_ARRAY[suitMasks[suit]]
+   return UNSUITED7_RANKS[np.searchsorted(UNSUITED7_KEYS, product)]
+
+
+@njit(cache=True, parallel=True)
+def mcEquity(holeBits: int, boardBits: int, trials: int, seed: int) -> float:
+   """
+   Estimate the equity of two hole cards against one random opponent hand.
+
+   Each trial deals the opponent two unseen cards and completes the board from the
+   rest, then scores both 7-card hands; a win counts 1 and a tie 0.5.
+
+   Parameters:
+      holeBits (int): 52-bit set (playingCard.bit) of the two hole cards.
+      boardBits (int): 52-bit set of the 0-5 community cards already dealt.
+      trials (int): Number of random completions to play out.
+      seed (int): Seed for the random completions, or -1 to continue the current stream.
+
+   Returns:
+      float: Average result over all trials, between 0 and 1.
+   """
+   known = holeBits | boardBits
+   hole = np.empty(2, dtype=np.int64)
+   board = np.empty(5, dtype=np.int64)
+   remaining = np.empty(52, dtype=np.int64)
+   holeSize = 0
+   boardSize = 0
+   remainingSize = 0
+   for bit in range(52):
+      if (holeBits >> bit) & 1:
+         hole[holeSize] = _DECK_CODES[bit]
+         holeSize += 1
+      elif (boardBits >> bit) & 1:
+         board[boardSize] = _DECK_CODES[bit]
+         boardSize += 1
+      elif not (known >> bit) & 1:
+         remaining[remainingSize] = _DECK_CODES[bit]
+         remainingSize += 1
+   needed = 2 + 5 - boardSize  # opponent hole cards plus the rest of the board
+
+   # Every trial's cards are drawn up front on this thread: each parallel worker has its
+   # own random state, so drawing inside the prange loop could not be replayed from a seed.
+   if seed >= 0:
+      np.random.seed(seed)
+   picks = np.empty((trials, 7), dtype=np.int64)
+   for trial in range(trials):
+      # Draw `needed` distinct unseen cards by rejecting repeated picks.
+      picked = 0
+      while picked < needed:
+         pick = np.random.randint(0, remainingSize)
+         for j in range(picked):
+            if picks[trial, j] == pick:
+               break
+         else:
+            picks[trial, picked] = pick
+            picked += 1
+
+   results = np.empty(trials, dtype=np.float64)
+   for trial in prange(trials):
+      hero = np.empty(7, dtype=np.int64)
+      villain = np.empty(7, dtype=np.int64)
+      hero[0] = hole[0]
+      hero[1] = hole[1]
+      villain[0] = remaining[picks[trial, 0]]
+      villain[1] = remaining[picks[trial, 1]]
+      for i in range(5):
+         card = board[i] if i < boardSize else remaining[picks[trial, 2 + i - boardSize]]
+         hero[2 + i] = card
+         villain[2 + i] = card
+
+      heroRank = evaluate7(hero)
+      villainRank = evaluate7(villain)
+      if heroRank < villainRank:
+         results[trial] = 1.0
+      elif heroRank == villainRank:
+         results[trial] = 0.5
+      else:
+         results[trial] = 0.0
+   return results.mean()
@@ -8,6 +8,8 @@ Description: Contains a simple placeholder decision-making system for the bot.
 
 import random
 
+_CHOICES = ("FOLD", "CALL", "RAISE")
+
 def botDecision() -> tuple[str, float]:
    """
    Generates a basic decision for the bot: "FOLD", "CALL", or "RAISE".
@@ -24,11 +26,11 @@ def botDecision() -> tuple[str, float]:
          - ("FOLD", 0) or ("CALL", 0) when the bot chooses fold or call.
          - ("RAISE", amount) when the bot chooses to raise, with a random amount between 10 and 50.
    """
-   options = ["FOLD", "CALL", "RAISE"]
-   choice = random.choice(options)
+   # One uniform draw picks the action with equal odds for each of the three choices.
+   choice = _CHOICES[int(random.random() * 3)]
 
    if choice == "RAISE":
-      raise_amount = random.randint(10, 50)
+      raise_amount = random.randrange(10, 51)
       return ("RAISE", raise_amount)
    else:
       return (choice, 0)
\ No newline at end of file
@@ -11,9 +11,7 @@ Description: Implements a smarter decision-making system for the bot.
 import random
 from hand_evaluator import evaluateHand
 
-from ml.predict_win_rate import predictWinRate
-
-def botDecisionWithEval(botHand: list) -> tuple[str, float]:
+def botDecisionWithEval(botHand: list, rng=random) -> tuple[str, float]:
    """
    Makes a decision for the bot based on the strength of its evaluated hand.
 
@@ -25,6 +23,8 @@ def botDecisionWithEval(botHand: list) -> tuple[str, float]:
 
    Parameters:
       botHand (list): List of Card objects representing the bot's current hand.
+      rng (random.Random): Source of the decision's randomness; pass a seeded
+         random.Random to replay a round. Defaults to the random module.
 
    Returns:
       tuple[str, float]:
@@ -38,53 +38,48 @@ def botDecisionWithEval(botHand: list) -> tuple[str, float]:
 
    # Define decision logic for each rank
    if handRank == 0:  # High Card
-      if random.random() < 0.8:
+      if rng.random() < 0.8:
          decision = ("FOLD", 0)
       else:
          decision = ("CALL", 0)
 
    elif handRank == 1:  # One Pair
-      if random.random() < 0.6:
+      if rng.random() < 0.6:
          decision = ("FOLD", 0)
       else:
          decision = ("CALL", 0)
 
    elif handRank == 2:  # Two Pair
-      if random.random() < 0.2:
+      if rng.random() < 0.2:
          decision = ("FOLD", 0)
       else:
          decision = ("CALL", 0)
 
    elif handRank == 3:  # Three of a Kind
-      if random.random() < 0.3:
+      if rng.random() < 0.3:
          decision = ("CALL", 0)
       else:
-         decision = ("RAISE", random.randint(20, 50))
+         decision = ("RAISE", rng.randint(20, 50))
 
    elif handRank == 4:  # Straight
-      if random.random() < 0.2:
+      if rng.random() < 0.2:
          decision = ("CALL", 0)
       else:
-         decision = ("RAISE", random.randint(30, 70))
+         decision = ("RAISE", rng.randint(30, 70))
 
    elif handRank == 5:  # Flush
-      decision = ("RAISE", random.randint(40, 80))
+      decision = ("RAISE", rng.randint(40, 80))
 
    elif handRank == 6:  # Full House
-      decision = ("RAISE", random.randint(60, 100))
+      decision = ("RAISE", rng.randint(60, 100))
 
    elif handRank == 7:  # Four of a Kind
-      decision = ("RAISE", random.randint(70, 120))
+      decision = ("RAISE", rng.randint(70, 120))
 
    elif handRank == 8:  # Straight Flush
-      decision = ("RAISE", random.randint(90, 150))
+      decision = ("RAISE", rng.randint(90, 150))
 
    elif handRank == 9:  # Royal Flush
-      decision = ("RAISE", random.randint(150, 200))
+      decision = ("RAISE", rng.randint(150, 200))
 
    return decision
-
-
-#--EXAMPLE USE FOR predictWinRate()--#
-# winRate = predictWinRate(player.hand)
-# print(f"Predicted win rate: {winRate:.2f}")
\ No newline at end of file
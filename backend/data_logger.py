@@ -11,10 +11,34 @@ Description: Handles creation and management of per-session CSV logs for PokerBo
              with detailed player/bot data for later analysis or ML training.
 """
 
+import atexit
 import csv
 import os
-from deck import playingCard
+import queue
+import threading
+from deck import joinCards
 from datetime import datetime
+from operator import itemgetter
+
+# Column order of the per-session round log.
+ROUND_COLUMNS = (
+   "Player Hand", "Bot Hand",
+   "Player Strength", "Bot Strength",
+   "Player Preflop Action", "Bot Preflop Action",
+   "Player Flop Action", "Bot Flop Action",
+   "Player Turn Action", "Bot Turn Action",
+   "Player River Action", "Bot River Action",
+   "Player Balance", "Winner",
+)
+
+# Pulls every ROUND_COLUMNS value out of a round dict in a single call.
+_getRoundValues = itemgetter(*ROUND_COLUMNS)
+
+# The writer thread writes a partial batch once no new round has arrived for this long.
+FLUSH_SECONDS = 0.1
+
+# Queue marker asking the writer thread to write out its partial batch right away.
+_FLUSH = object()
 
 class PokerDataLogger:
    """
@@ -22,29 +46,57 @@ class PokerDataLogger:
    
    When logging is enabled, a timestamped file (poker_bot_MMDD_HH_MM.csv)
    is created under the /data directory with the appropriate header row.
-   Each completed round is appended as one row.
+   Each completed round is appended as one row and handed to a background
+   writer thread, so the game loop never waits on CSV formatting or disk
+   writes. The thread writes rows in batches of up to chunkSize and writes
+   a partial batch as soon as no new round arrives for FLUSH_SECONDS, so a
+   crash loses at most the last fraction of a second of rounds.
 
    Attributes:
       enableLogging (bool): Whether logging is active for the current session.
       filePath (str): Absolute path to the active CSV file. 
    """
    
-   def __init__(self, enableLogging: bool = False):
+   def __init__(self, enableLogging: bool = False, chunkSize: int = 64):
       """
       Initialize the PokerDataLogger and create a CSV file if logging is enabled.
 
       Parameters:
          enableLogging (bool): True to start a new logging session, False to disable.
+         chunkSize (int): Most rounds the writer thread writes out in one batch.
       """
       self.enableLogging = enableLogging
       self.filePath = None
+      self.chunkSize = chunkSize
+      self._file = None
+      self._writer = None
+      self._queue = None
+      self._thread = None
+      # First exception raised in the writer thread, re-raised on the caller's side.
+      self._error = None
 
       if enableLogging:
          # Build a unique timestamped filename: poker_bot_MMD_HH_MM.csv
          timestamp = datetime.now().strftime("%m%d_%H_%M")
          os.makedirs("data", exist_ok=True)
          self.filePath = os.path.join("data", f"poker_bot_{timestamp}.csv")
+         # Keep one handle open for the whole session instead of reopening per round.
+         self._file = open(self.filePath, mode="w", newline="", encoding="utf-8", buffering=1 << 20)
+         self._writer = csv.writer(self._file, lineterminator="\n")
          self._writeHeader()
+         # From here on only the writer thread touches the file. The bounded queue makes
+         # appendRound wait if the thread falls a few batches behind.
+         self._queue = queue.Queue(maxsize=4 * chunkSize)
+         self._thread = threading.Thread(target=self._drain, name="PokerDataLogger", daemon=True)
+         self._thread.start()
+         # Make sure every queued round still reaches disk when the CLI exits.
+         atexit.register(self.close)
+
+   def __enter__(self):
+      return self
+
+   def __exit__(self, excType, excValue, traceback) -> None:
+      self.close()
 
    def _writeHeader(self) -> None:
       """
@@ -53,62 +105,197 @@ class PokerDataLogger:
       Returns:
          None
       """
-      header = [
-         "Player Hand", "Bot Hand",
-         "Player Strength", "Bot Strength",
-         "Player Preflop Action", "Bot Preflop Action",
-         "Player Flop Action", "Bot Flop Action",
-         "Player Turn Action", "Bot Turn Action",
-         "Player River Action", "Bot River Action",
-         "Player Balance", "Winner"
-      ]
+      self._writer.writerow(ROUND_COLUMNS)
+
+   def _drain(self) -> None:
+      """
+      Writer thread: collect queued rows into batches and write each batch, until close()
+      sends None.
+
+      A batch is written once it holds chunkSize rows, when flush() or close() asks for
+      it, or when no row has arrived for FLUSH_SECONDS. Every queue item is marked done
+      even if the write fails, so flush() and close() can never wait forever.
+
+      Returns:
+         None
+      """
+      batch = []
+      pending = 0  # queue items taken but not yet marked done
+      while True:
+         try:
+            item = self._queue.get(timeout=FLUSH_SECONDS if batch else None)
+            pending += 1
+         except queue.Empty:
+            item = _FLUSH  # quiet for a while: write the partial batch
+         if item is not None and item is not _FLUSH:
+            batch.append(item)
+            if len(batch) < self.chunkSize:
+               continue
+         self._writeBatch(batch)
+         batch = []
+         for _ in range(pending):
+            self._queue.task_done()
+         pending = 0
+         if item is None:
+            return
+
+   def _writeBatch(self, batch: list) -> None:
+      """
+      Write one batch of rows and flush it to disk, recording the first failure instead of
+      letting it end the writer thread.
+
+      Returns:
+         None
+      """
+      if self._error is not None:
+         return
+      try:
+         if batch:
+            self._writer.writerows(batch)
+         self._file.flush()
+      except Exception as error:
+         self._error = error
+
+   def _raiseWriteError(self) -> None:
+      """
+      Re-raise a failure from the writer thread in the calling thread.
 
-      with open(self.filePath, mode="w", newline="", encoding="utf-8") as file:
-         writer = csv.writer(file)
-         writer.writerow(header)
+      Returns:
+         None
+      """
+      if self._error is not None:
+         raise OSError(f"Could not write {self.filePath}") from self._error
 
-   def appendRound(self, row: dict) -> None:
+   def appendRound(self, row: dict | list | tuple) -> None:
       """
-      Append a single round of data to the CSV file.
+      Queue a single round of data for the writer thread.
 
       Parameters: 
-         row (dict): Dictionary containing round data keyed by header names.
+         row (dict | list | tuple): Dictionary containing round data keyed by header names,
+            or the values already in ROUND_COLUMNS order.
 
       Returns: 
          None
       """
-      if not self.enableLogging or not self.filePath:
+      if not self.enableLogging or self._queue is None:
+         return
+      self._raiseWriteError()
+
+      if isinstance(row, dict):
+         try:
+            row = _getRoundValues(row)
+         except KeyError:
+            # Partial rows leave any missing columns blank.
+            row = [row.get(column, "") for column in ROUND_COLUMNS]
+      self._queue.put(row)
+
+   def flush(self) -> None:
+      """
+      Wait until the writer thread has written and flushed every round queued so far.
+
+      Returns:
+         None
+      """
+      if self._queue is None:
+         return
+      self._queue.put(_FLUSH)
+      self._queue.join()
+      self._raiseWriteError()
+
+   def close(self) -> None:
+      """
+      Write any queued rounds, stop the writer thread and close the CSV file. Safe to call
+      more than once.
+
+      Returns:
+         None
+      """
+      if self._queue is None:
          return
-      
-      with open(self.filePath, mode="a", newline="", encoding="utf-8") as file:
-         writer = csv.writer(file)
-         writer.writerow([
-            row.get("Player Hand", ""),
-            row.get("Bot Hand", ""),
-            row.get("Player Strength", ""),
-            row.get("Bot Strength", ""),
-            row.get("Player Preflop Action", ""),
-            row.get("Bot Preflop Action", ""),
-            row.get("Player Flop Action", ""),
-            row.get("Bot Flop Action", ""),
-            row.get("Player Turn Action", ""),
-            row.get("Bot Turn Action", ""),
-            row.get("Player River Action", ""),
-            row.get("Bot River Action", ""),
-            row.get("Player Balance", ""),
-            row.get("Winner", "")            
-         ])
-
-def logGameResult(playerHand: list, botHand: list, communityCards: list, playerAction: str, botAction: str, winner: str) -> None:
+      self._queue.put(None)
+      self._thread.join()
+      file = self._file
+      self._file = None
+      self._writer = None
+      self._queue = None
+      self._thread = None
+      # Already flushed and closed; drop the exit hook so it no longer keeps the logger alive.
+      atexit.unregister(self.close)
+      try:
+         file.close()
+      except OSError as error:
+         if self._error is None:
+            self._error = error
+      self._raiseWriteError()
+
+# Open handle and writer for data/hands.csv, created by the first logGameResult call
+# so the directory/header checks only happen once per process.
+_LOG_STATE = {"file": None, "writer": None}
+
+
+def _openHandsLog():
+   """
+   Open 'data/hands.csv' for appending, writing the header row if the file is new.
+
+   Returns:
+      csv.writer: Writer bound to the open file.
+   """
+   os.makedirs("data", exist_ok=True)
+   file_path = os.path.join("data", "hands.csv")
+
+   # Check if file exists to decide if we need to write a header
+   file_exists = os.path.isfile(file_path)
+
+   file = open(file_path, mode="a", newline="", encoding="utf-8", buffering=1 << 20)
+   writer = csv.writer(file, lineterminator="\n")
+   if not file_exists:
+      writer.writerow(["Player Hand", "Bot Hand", "Community Cards", "Player Action", "Bot Action", "Winner"])
+
+   _LOG_STATE["file"] = file
+   _LOG_STATE["writer"] = writer
+   atexit.register(_closeHandsLog)
+   return writer
+
+
+def _closeHandsLog() -> None:
+   """
+   Flush and close 'data/hands.csv' if it is open.
+
+   Returns:
+      None
+   """
+   file = _LOG_STATE["file"]
+   if file is not None:
+      file.close()
+      _LOG_STATE["file"] = None
+      _LOG_STATE["writer"] = None
+
+
+def _buildHandsRow(playerHand: list, botHand: list, communityCards: list | None, playerAction: str, botAction: str, winner: str) -> list[str]:
+   """
+   Convert one finished round into a 'data/hands.csv' row.
+
+   Returns:
+      list[str]: Row values in the order of the hands.csv header.
+   """
+   # Convert hands to string form
+   playerHandStr = joinCards(playerHand)
+   botHandStr = joinCards(botHand)
+   communityStr = joinCards(communityCards) if communityCards else ""
+   return [playerHandStr, botHandStr, communityStr, playerAction, botAction, winner]
+
+
+def logGameResult(playerHand: list, botHand: list, communityCards: list | None, playerAction: str, botAction: str, winner: str) -> None:
    """
    Logs the result of a completed poker round to 'data/hands.csv'.
 
    Each row includes the player's hand, bot's hand, community cards, actions, and the round winner.
+   The file is opened on the first call and kept open until the process exits.
 
    Parameters:
       playerHand (list): List of playingCard objects representing the player's hand.
       botHand (list): List of playingCard objects representing the bot's hand.
-      communityCards (list): List of shared community playingCard objects.
+      communityCards (list | None): List of shared community playingCard objects, or None if none were dealt.
       playerAction (str): The final action taken by the player ("FOLD", "CALL", or "RAISE").
       botAction (str): The final action taken by the bot ("FOLD", "CALL", or "RAISE").
       winner (str): Label indicating who won the round ("Player" or "Bot").
@@ -116,22 +303,5 @@ def logGameResult(playerHand: list, botHand: list, communityCards: list, playerA
    Returns:
       None
    """
-
-   # Ensure the data folder exists
-   os.makedirs("data", exist_ok=True)
-   file_path = os.path.join("data", "hands.csv")
-
-   # Convert hands to string form
-   playerHandStr = ", ".join(str(card) for card in playerHand)
-   botHandStr = ", ".join(str(card) for card in botHand)
-
-   # Check if file exists to decide if we need to write a header
-   file_exists = os.path.isfile(file_path)
-
-   # Write data to CSV file
-   with open(file_path, mode="a", newline="", encoding="utf-8") as file:
-      writer = csv.writer(file)
-      if not file_exists:
-         writer.writerow(["Player Hand", "Bot Hand", "Community Cards", "Player Action", "Bot Action", "Winner"])
-      communityStr = ", ".join(str(card) for card in communityCards)
-      writer.writerow([playerHandStr, botHandStr, communityStr, playerAction, botAction, winner])
+   writer = _LOG_STATE["writer"] or _openHandsLog()
+   writer.writerow(_buildHandsRow(playerHand, botHand, communityCards, playerAction, botAction, winner))
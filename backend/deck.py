@@ -5,7 +5,38 @@ Created: 10/12/2025
 Description: Contains the playingCard and cardDeck classes along with deck-related errors.
 """
 
-import random
+import numpy as np
+
+
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+SUITS = ("Hearts", "Diamonds", "Clubs", "Spades")
+
+# Numeric value of each rank: "2" is worth 2 points up to "A" worth 14.
+_RANK_VALUES = {rank: rankIndex + 2 for rankIndex, rank in enumerate(RANKS)}
+
+# Cactus Kev card encoding: every card is a single int laid out as
+#   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+# b = one bit per rank, cdhs = suit flag, r = rank index (0-12), p = rank prime.
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {"Spades": 0x1000, "Hearts": 0x2000, "Clubs": 0x4000, "Diamonds": 0x8000}
+
+CARD_INTS = {
+   (rank, suit): (1 << (16 + rankIndex)) | SUIT_BITS[suit] | (rankIndex << 8) | RANK_PRIMES[rankIndex]
+   for rankIndex, rank in enumerate(RANKS)
+   for suit in SUITS
+}
+
+# Each card also owns one bit of a 52-bit set (in CARD_INTS order), so a hand or board
+# can be carried as a single int: OR in a card's bit as it is dealt.
+BIT_CODES = tuple(CARD_INTS.values())
+CARD_BITS = {code: 1 << index for index, code in enumerate(BIT_CODES)}
+
+# Display form ("10 of Hearts") of each card, keyed by its card int.
+CARD_STR = {code: f"{rank} of {suit}" for (rank, suit), code in CARD_INTS.items()}
+
+# Display names indexed by rank value (2-14) and keyed by suit flag.
+_RANK_STR = ("", "") + RANKS
+_SUIT_STR = {suitBit: suit for suit, suitBit in SUIT_BITS.items()}
 
 
 class emptyDeckError(Exception):
@@ -15,80 +46,159 @@ class emptyDeckError(Exception):
 class playingCard:
    """
    Represents a single playing card rank and suit (10 of Hearts)
+
+   The rank is stored as its value (2-14) and the suit as its flag from SUIT_BITS,
+   so comparisons never touch strings; use playingCard.fromStr("10", "Hearts") to
+   build a card from display names.
    """
-   def __init__(self, rank, suit):
+   def __init__(self, rank: int, suit: int):
       self.rank = rank
       self.suit = suit
+      self.code = CARD_INTS[(_RANK_STR[rank], _SUIT_STR[suit])]
+      self.bit = CARD_BITS[self.code]
+      self._str = CARD_STR[self.code]
+
+   @classmethod
+   def fromStr(cls, rank: str, suit: str) -> "playingCard":
+      """
+      Build a card from its display rank and suit, e.g. fromStr("10", "Hearts").
+      """
+      return cls(_RANK_VALUES[rank], SUIT_BITS[suit])
 
    def __str__(self):
       """
       Return a readable version of card for CLI printout
       """
-      return f"{self.rank} of {self.suit}"
+      return self._str
 
    def __repr__(self):
       """
       Return a developer readable version of card for ranking printout
       """
-      return f"Card('{self.rank}', '{self.suit}')"
+      return f"Card.fromStr('{_RANK_STR[self.rank]}', '{_SUIT_STR[self.suit]}')"
 
    def getValue(self):
       """
       Return the value of the card as an integer. The value is based on the rank of the card.
       For example, a "2" is worth 2 points, while a "K" is worth 13 points.
       """
-      rankValues = {
-         "2": 2,
-         "3": 3,
-         "4": 4,
-         "5": 5,
-         "6": 6,
-         "7": 7,
-         "8": 8,
-         "9": 9,
-         "10": 10,
-         "J": 11,
-         "Q": 12,
-         "K": 13,
-         "A": 14
-      }
-      return rankValues.get(self.rank,0)
+      return self.rank
 
 
 class cardDeck:
    """
    Represents a deck of 52 playing cards
    handles shuffling and drawing cards
+
+   All 52 cards always stay in self.cards; the cards still in the deck are
+   self.cards[:self.top], and drawing or burning just moves self.top down.
+   Shuffles use the deck's own NumPy generator; pass a seed to replay a deal.
    """
 
-   def __init__(self):
-      suits = ["Hearts", "Diamonds", "Clubs", "Spades"]
-      ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-      # Pre-build a standard 52-card set so we can reshuffle or reset quickly.
-      self.cards = [playingCard(rank, suit) for rank in ranks for suit in suits]
+   def __init__(self, seed=None):
+      # One list of the shared 52 card objects for the deck's whole life; shuffles
+      # rearrange it in place, so a reset never replaces the list or creates new cards.
+      self.cards = list(_BASE_DECK)
+      self.top = len(self.cards)
+      self._rng = np.random.default_rng(seed)
+      # Card order as indices into _BASE_DECK; a full shuffle permutes these uint8s in
+      # NumPy (about 4 us against 19 us for random.shuffle on the 52 card objects).
+      self._order = np.arange(len(self.cards), dtype=np.uint8)
+
+   def __len__(self):
+      """ number of cards still in the deck """
+      return self.top
 
    def shuffle(self):
-      """ shuffle the deck randomly"""
-      random.shuffle(self.cards)
+      """ shuffle the cards remaining in the deck randomly
+      callers that only need a few random cards (shuffle, draw 2, discard the deck)
+      should use sample() instead, which avoids permuting the whole deck
+      """
+      top = self.top
+      if top == len(self.cards):
+         order = self._order
+         self._rng.shuffle(order)
+         self.cards[:] = [_BASE_DECK[i] for i in order.tolist()]
+      else:
+         remaining = self.cards[:top]
+         self.cards[:top] = [remaining[i] for i in self._rng.permutation(top).tolist()]
 
    def draw(self, n=1):
       """ draw n cards from the deck
       returns a list if n > 1, otherwise returns a single card
       """
-      if len(self.cards) < n:
+      if self.top < n:
          # The caller will reshuffle if we notify them the deck ran dry.
          raise emptyDeckError("Not enough cards in the deck to draw.")
-      drawn = [self.cards.pop() for _ in range(n)]
-      return drawn[0] if n == 1 else drawn
+      self.top -= n
+      return self.cards[self.top] if n == 1 else self.cards[self.top:self.top + n]
    
+   def sample(self, k=1):
+      """ draw k random cards from the deck without shuffling it first
+      performs only k swaps (a partial Fisher-Yates shuffle) and always returns a list
+      """
+      if self.top < k:
+         raise emptyDeckError("Not enough cards in the deck to sample.")
+      cards = self.cards
+      top = self.top
+      # One generator call draws every swap position: pick i is uniform over the top - i
+      # cards not yet sampled.
+      for pick in self._rng.integers(0, np.arange(top, top - k, -1)).tolist():
+         top -= 1
+         cards[pick], cards[top] = cards[top], cards[pick]
+      self.top = top
+      return cards[top:top + k]
+
    def burn(self, n=1):
       """ burn n cards from the deck"""
-      if len(self.cards) < n:
+      if self.top < n:
          raise emptyDeckError("Not enough cards in the deck to burn.")
-      for _ in range(n):
-         self.cards.pop()
+      self.top -= n
+
+   def dealBoard(self):
+      """ burn and deal all five community cards in one call
+      returns [flop1, flop2, flop3, turn, river], the same cards dealing each street
+      with a burn before it would give
+      """
+      if self.top < 8:
+         raise emptyDeckError("Not enough cards in the deck to deal the board.")
+      top = self.top
+      cards = self.cards
+      self.top = top - 8
+      return cards[top - 4:top - 1] + [cards[top - 6], cards[top - 8]]
 
    def reset(self):
       """ reset the deck and shuffle"""
-      self.__init__()
+      # Drawn cards never leave self.cards, so restoring the pointer refills the deck.
+      self.top = len(self.cards)
       self.shuffle()
+
+
+def joinCards(cards) -> str:
+   """
+   Return the cards as a comma-separated display string, e.g. "10 of Hearts, A of Spades".
+
+   Each card's display string is built once in playingCard.__init__, so this is a plain
+   join with no per-card __str__ dispatch.
+   """
+   return ", ".join([card._str for card in cards])
+
+
+def bitsToCodes(bits: int) -> list:
+   """
+   Return the card ints of every card in a 52-bit card set (see playingCard.bit).
+   """
+   codes = []
+   while bits:
+      lowest = bits & -bits
+      codes.append(BIT_CODES[lowest.bit_length() - 1])
+      bits ^= lowest
+   return codes
+
+
+# The 52 canonical cards, built once at import and shared by every deck.
+_BASE_DECK = tuple(playingCard.fromStr(rank, suit) for (rank, suit) in CARD_INTS)
+
+# Shorter aliases; __repr__ prints cards as Card.fromStr(...), which evaluates back to the card.
+Card = playingCard
+Deck = cardDeck
@@ -5,6 +5,31 @@ Created: 10/19/2025
 Description: Handles terminal-based user input allowing the player to choose between actions "fold", "call", or "raise" each round.
 """
 
+import sys
+
+_VALID_CHOICES = frozenset("fcr")
+
+
+def _readInput(prompt: str) -> str:
+   """
+   Read one line of player input. When stdin is not a terminal (piped or scripted
+   input) the line is read straight from sys.stdin instead of going through input().
+
+   Parameters:
+      prompt (str): Text shown before reading.
+
+   Returns:
+      str: The line entered, without the trailing newline.
+   """
+   if sys.stdin.isatty():
+      return input(prompt)
+   print(prompt, end="", flush=True)
+   line = sys.stdin.readline()
+   if not line:
+      raise EOFError("No more player input.")
+   return line.rstrip("\n")
+
+
 def getPlayerAction() -> tuple[str, float]:
    """
    Prompts the player to choose an action: fold, call, or raise.
@@ -14,28 +39,28 @@ def getPlayerAction() -> tuple[str, float]:
          - ("FOLD", 0) or ("CALL", 0) for fold/call.
          - ("RAISE", amount) when the player raises.
    """
-   try:
-      choice = input("Choose [f]old [c]all [r]aise: ").strip().lower()
-      if choice not in {"f", "c", "r"}:
-         raise ValueError("Invalid input. Please choose 1, 2, or 3.")
-
-      if choice == "f":
-         print("FOLD")
-         return ("FOLD", 0)
-      if choice == "c":
-         print("CALL")
-         return ("CALL", 0)
-
-      # Handle raise workflow
-      amount_input = input("Enter raise amount: ").strip()
-      if not amount_input.isdigit() or int(amount_input) <= 0:
-         raise ValueError("Invalid raise amount. Please enter a positive whole number.")
-
-      amount = int(amount_input)
-      print("RAISE:", amount)
-      return ("RAISE", amount)
-
-   except ValueError as err:
-      print(err)
-      # Recursively prompt again until the user supplies a valid choice.
-      return getPlayerAction()
+   while True:
+      try:
+         choice = _readInput("Choose [f]old [c]all [r]aise: ").strip().lower()
+         if choice not in _VALID_CHOICES:
+            raise ValueError("Invalid input. Please choose 1, 2, or 3.")
+
+         if choice == "f":
+            print("FOLD")
+            return ("FOLD", 0)
+         if choice == "c":
+            print("CALL")
+            return ("CALL", 0)
+
+         # Handle raise workflow
+         amount_input = _readInput("Enter raise amount: ").strip()
+         if not amount_input.isdigit() or int(amount_input) <= 0:
+            raise ValueError("Invalid raise amount. Please enter a positive whole number.")
+
+         amount = int(amount_input)
+         print("RAISE:", amount)
+         return ("RAISE", amount)
+
+      except ValueError as err:
+         # Report the problem and prompt again until the user supplies a valid choice.
+         print(err)
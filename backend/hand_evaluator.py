@@ -5,49 +5,321 @@ Created: 10/18/2025
 Description: Determines the strength of poker hand.
 """
 
-from collections import Counter     
+from array import array
+from bisect import bisect_left
+from itertools import combinations, combinations_with_replacement
+
+import numpy as np
+
+from deck import RANK_PRIMES
+
+# Rank bitfields of the ten straights, from Ace-high down to the wheel (A-2-3-4-5).
+WHEEL_MASK = 0b1000000001111
+STRAIGHT_MASKS = tuple(0b11111 << low for low in range(8, -1, -1)) + (WHEEL_MASK,)
+_STRAIGHT_SET = frozenset(STRAIGHT_MASKS)
+
+# Last Cactus Kev rank (1 = Royal Flush ... 7462 = 7-5-4-3-2) of each hand category,
+# strongest category first.
+_CATEGORY_BOUNDS = (1, 10, 166, 322, 1599, 1609, 2467, 3325, 6185)
+
+# Masks selecting bit 0 / bit 2 of each of the 13 per-rank count nibbles.
+_NIBBLE_ONES = 0x1111111111111
+_NIBBLE_FOURS = 0x4444444444444
+
+
+def _primeProduct(rankMask: int) -> int:
+   """
+   Multiply the rank primes of every rank set in a 13-bit rank bitfield.
+   """
+   product = 1
+   for rankIndex in range(13):
+      if rankMask & (1 << rankIndex):
+         product *= RANK_PRIMES[rankIndex]
+   return product
+
+
+def _buildLookupTables() -> tuple[array, dict, array, array]:
+   """
+   Enumerate all 7462 distinct 5-card hands from strongest to weakest and build the lookup tables.
+
+   Returns:
+      tuple: (flush table indexed by rank bitfield, non-flush table keyed by prime product,
+              hand category (0-9) indexed by Cactus Kev rank,
+              high card value (2-14) indexed by Cactus Kev rank)
+   """
+   flushLookup = array("H", [0]) * 8192
+   unsuitedLookup = {}
+   descending = range(12, -1, -1)
+   primes = RANK_PRIMES
+   rankMasks = [0]  # rank bitfield of the hand at each Cactus Kev rank (index 0 unused)
+
+   def addHand(table, key: int, rankMask: int) -> None:
+      table[key] = len(rankMasks)
+      rankMasks.append(rankMask)
+
+   # Five distinct ranks in descending strength order, straights excluded.
+   distinctMasks = [
+      mask for mask in (sum(1 << r for r in combo) for combo in combinations(descending, 5))
+      if mask not in _STRAIGHT_SET
+   ]
+
+   for mask in STRAIGHT_MASKS:  # Straight Flush (Royal Flush first)
+      addHand(flushLookup, mask, mask)
+   for quad in descending:  # Four of a Kind
+      for kicker in descending:
+         if kicker != quad:
+            addHand(unsuitedLookup, primes[quad] ** 4 * primes[kicker], (1 << quad) | (1 << kicker))
+   for trips in descending:  # Full House
+      for pair in descending:
+         if pair != trips:
+            addHand(unsuitedLookup, primes[trips] ** 3 * primes[pair] ** 2, (1 << trips) | (1 << pair))
+   for mask in distinctMasks:  # Flush
+      addHand(flushLookup, mask, mask)
+   for mask in STRAIGHT_MASKS:  # Straight
+      addHand(unsuitedLookup, _primeProduct(mask), mask)
+   for trips in descending:  # Three of a Kind
+      for k1, k2 in combinations([r for r in descending if r != trips], 2):
+         addHand(unsuitedLookup, primes[trips] ** 3 * primes[k1] * primes[k2],
+                 (1 << trips) | (1 << k1) | (1 << k2))
+   for high, low in combinations(descending, 2):  # Two Pair
+      for kicker in descending:
+         if kicker != high and kicker != low:
+            addHand(unsuitedLookup, primes[high] ** 2 * primes[low] ** 2 * primes[kicker],
+                    (1 << high) | (1 << low) | (1 << kicker))
+   for pair in descending:  # One Pair
+      for k1, k2, k3 in combinations([r for r in descending if r != pair], 3):
+         addHand(unsuitedLookup, primes[pair] ** 2 * primes[k1] * primes[k2] * primes[k3],
+                 (1 << pair) | (1 << k1) | (1 << k2) | (1 << k3))
+   for mask in distinctMasks:  # High Card
+      addHand(unsuitedLookup, _primeProduct(mask), mask)
+
+   handCategory = array("B", (9 - bisect_left(_CATEGORY_BOUNDS, r) for r in range(len(rankMasks))))
+   # The top rank bit is the strongest card (bit 0 is a "2"), except in the wheel where
+   # the Ace plays low and the straight is only five-high.
+   handHigh = array("B", (5 if mask == WHEEL_MASK else mask.bit_length() + 1 for mask in rankMasks))
+   return flushLookup, unsuitedLookup, handCategory, handHigh
+
+
+def _buildSevenCardTables() -> tuple[array, dict]:
+   """
+   Extend the 5-card tables to the best 5-card rank of any 6- or 7-card hand.
+
+   The best rank of a hand is the best rank among the hands left after removing any
+   one card, so each hand size is built from the size below it.
+
+   Returns:
+      tuple: (flush table indexed by the 5-7 bit rank bitfield of the flush suit,
+              non-flush table keyed by the prime product of 5-7 cards)
+   """
+   flushLookup = array("H", FLUSH_LOOKUP)
+   for bits in (6, 7):
+      for mask in range(8192):
+         if mask.bit_count() == bits:
+            best = 7462
+            remaining = mask
+            while remaining:
+               lowest = remaining & -remaining
+               best = min(best, flushLookup[mask ^ lowest])
+               remaining ^= lowest
+            flushLookup[mask] = best
+
+   unsuitedLookup = dict(UNSUITED_LOOKUP)
+   for size in (6, 7):
+      for ranks in combinations_with_replacement(range(13), size):
+         if any(ranks[i] == ranks[i + 4] for i in range(size - 4)):  # five of a kind
+            continue
+         product = 1
+         for r in ranks:
+            product *= RANK_PRIMES[r]
+         unsuitedLookup[product] = min(unsuitedLookup[product // RANK_PRIMES[r]] for r in set(ranks))
+   return flushLookup, unsuitedLookup
+
+
+FLUSH_LOOKUP, UNSUITED_LOOKUP, HAND_CATEGORY, HAND_HIGH = _buildLookupTables()
+FLUSH7_LOOKUP, UNSUITED7_LOOKUP = _buildSevenCardTables()
+
+# NumPy views of the seven-card tables for the Numba and C evaluators. The non-flush
+# dict becomes two parallel arrays sorted by prime product so it can be binary-searched.
+FLUSH7_LOOKUP_ARRAY = np.frombuffer(FLUSH7_LOOKUP, dtype=np.uint16)
+UNSUITED7_KEYS = np.array(sorted(UNSUITED7_LOOKUP), dtype=np.int64)
+UNSUITED7_RANKS = np.array([UNSUITED7_LOOKUP[key] for key in UNSUITED7_KEYS.tolist()], dtype=np.uint16)
+
+# Per-suit card counts are packed 4 bits per suit; indexing by a suit flag (1, 2, 4, 8)
+# gives the increment for that suit's nibble.
+_SUIT_COUNT_STEP = (0, 1, 1 << 4, 0, 1 << 8, 0, 0, 0, 1 << 12)
+
 
 def evaluateHand(hand: list) -> tuple[int, int]:
    """
    Evaluates the strength of a poker hand.
 
+   Five-card hands are scored with the Cactus Kev lookup tables, two-card (preflop)
+   hands can only be a pair or high card, and any other hand size falls back to
+   counting ranks and suits directly.
+
+   Parameters:
+      hand (Sequence): Card objects representing the player's hand (list or tuple).
+
+   Returns:
+      tuple: (Numerical score representing the hand's strength, Numerical score of the strongest card in the hand)
+   """
+   if len(hand) != 5:
+      if len(hand) == 2:
+         return _evaluatePreflop(hand[0].code, hand[1].code)
+      return _evaluateGeneric(hand)
+   # Unpack directly rather than through a comprehension so no list is built per call.
+   card1, card2, card3, card4, card5 = hand
+   rank = _rank5(card1.code, card2.code, card3.code, card4.code, card5.code)
+   return (HAND_CATEGORY[rank], HAND_HIGH[rank])
+
+
+def _rank5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+   """
+   Look up the Cactus Kev rank of exactly five card ints.
+
+   Returns:
+      int: 1 (Royal Flush) to 7462 (7-high).
+   """
+   if c1 & c2 & c3 & c4 & c5 & 0xF000:  # every card shares a suit flag
+      return FLUSH_LOOKUP[(c1 | c2 | c3 | c4 | c5) >> 16]
+   return UNSUITED_LOOKUP[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def evaluate7(cards) -> int:
+   """
+   Scores the best 5-card hand within five to seven cards without trying every combination.
+
+   Parameters:
+      cards (Sequence): 5-7 Card objects (hole cards plus community cards).
+
+   Returns:
+      int: Cactus Kev rank of the best 5-card hand, 1 (Royal Flush) to 7462 (7-high).
+           HAND_CATEGORY and HAND_HIGH map it to evaluateHand's (category, high card).
+   """
+   return evaluate7Codes([card.code for card in cards])
+
+
+def evaluate7Codes(codes) -> int:
+   """
+   Scores the best 5-card hand within five to seven card ints (playingCard.code).
+
+   Parameters:
+      codes (Iterable): 5-7 card ints.
+
+   Returns:
+      int: Cactus Kev rank of the best 5-card hand, 1 (Royal Flush) to 7462 (7-high).
+   """
+   # Suit counts share one nibble-packed int rather than four per-suit rank masks: a
+   # single add per card is cheaper in CPython than indexing a list, and the flush
+   # suit's ranks are only gathered in the rare case one exists.
+   product = 1
+   suitCounts = 0
+   for code in codes:
+      product *= code & 0xFF
+      suitCounts += _SUIT_COUNT_STEP[(code >> 12) & 0xF]
+
+   # A suit nibble of 5 or more (bit 2 plus bit 0 or 1) means a flush. With at most
+   # seven cards a flush also rules out quads and full houses, so it is the best hand.
+   flushNibble = (suitCounts >> 2) & (suitCounts | (suitCounts >> 1)) & 0x1111
+   if flushNibble:
+      suitFlag = 0x1000 << ((flushNibble.bit_length() - 1) >> 2)
+      rankMask = 0
+      for code in codes:
+         if code & suitFlag:
+            rankMask |= code >> 16
+      return FLUSH7_LOOKUP[rankMask]
+   return UNSUITED7_LOOKUP[product]
+
+
+def evaluateCodes(codes) -> tuple[int, int]:
+   """
+   Evaluates a hand given as card ints (playingCard.code) rather than Card objects.
+
+   Parameters:
+      codes (Collection): Card ints in any order (list, tuple or set); five to seven
+         are scored as the best 5-card hand.
+
+   Returns:
+      tuple: Same (hand category, high card) pair evaluateHand returns.
+   """
+   size = len(codes)
+   if size == 5:
+      # Exactly five cards go straight to the 5-card tables, with no suit counting.
+      rank = _rank5(*codes)
+      return (HAND_CATEGORY[rank], HAND_HIGH[rank])
+   if 5 < size <= 7:
+      rank = evaluate7Codes(codes)
+      return (HAND_CATEGORY[rank], HAND_HIGH[rank])
+   if size == 2:
+      return _evaluatePreflop(*codes)
+   return _evaluateGenericCodes(codes)
+
+
+def _evaluatePreflop(code1: int, code2: int) -> tuple[int, int]:
+   """
+   Evaluates a two-card preflop hand from its card ints; it is either One Pair or High Card.
+
+   Returns:
+      tuple: (1 for a pair or 0 otherwise, value of the higher card)
+   """
+   value1 = ((code1 >> 8) & 0xF) + 2
+   value2 = ((code2 >> 8) & 0xF) + 2
+   if value1 == value2:
+      return (1, value1)
+   return (0, value1 if value1 > value2 else value2)
+
+
+def _evaluateGeneric(hand: list) -> tuple[int, int]:
+   """
+   Evaluates the strength of a hand that does not contain exactly five cards.
+
    Parameters:
       hand (list): List of Card objects representing the player's hand.
 
    Returns:
       tuple: (Numerical score representing the hand's strength, Numerical score of the strongest card in the hand)
    """
-   handRank = 0 
-   highCardValue = 0 
-   listOfRanks = [] 
-   listOfSuits = [] 
-   hand.sort(key=lambda card: card.getValue()) # Sort (least to greatest) the cards based on their rank value returned by getValue()
-   for i in hand:
-      listOfRanks.append(i.getValue())
-      listOfSuits.append(i.suit)
-   rankCounts = Counter(listOfRanks) # Counts the number of times a rank appears in a hand
-   isFlush = len(set(listOfSuits)) == 1 # Check for a Flush: five cards of the same suit, not in sequence
-   isStraight = all(listOfRanks[i] + 1 == listOfRanks[i + 1] for i in range(len(listOfRanks) - 1)) # Check for a Straight: five non-suited cards in sequence
-   isRoyal = listOfRanks == [10, 11, 12, 13, 14]
-   if isFlush and isRoyal:
-      handRank = 9
-   elif isFlush and isStraight:
+   return _evaluateGenericCodes([card.code for card in hand])
+
+
+def _evaluateGenericCodes(codes: list) -> tuple[int, int]:
+   """
+   Card-int version of _evaluateGeneric.
+   """
+   # One pass builds a 13-bit rank bitfield, the OR of the suit flags and a per-rank
+   # count packed 4 bits per rank (nibble i counts cards of rank index i).
+   rankMask = 0
+   suitMask = 0
+   rankCounts = 0
+   for code in codes:
+      rankMask |= code >> 16
+      suitMask |= code & 0xF000
+      rankCounts += 1 << ((code >> 6) & 0x3C)  # 4 * rank index
+
+   isFlush = suitMask & (suitMask - 1) == 0 # Check for a Flush: every card carries the same suit flag
+   lowestRank = rankMask & -rankMask
+   isStraight = rankMask == ((1 << len(codes)) - 1) * lowestRank # Check for a Straight: distinct ranks in one unbroken run
+   # A nibble can only hold 0-4, so each count is recognised from its bit pattern.
+   hasFour = rankCounts & _NIBBLE_FOURS
+   hasThree = rankCounts & (rankCounts >> 1) & _NIBBLE_ONES
+   pairCount = ((rankCounts >> 1) & ~rankCounts & _NIBBLE_ONES).bit_count()
+   if isFlush and isStraight:
       handRank = 8
-   elif 4 in rankCounts.values():
+   elif hasFour:
       handRank = 7
-   elif 3 in rankCounts.values() and 2 in rankCounts.values():
-      handRank = 6     
+   elif hasThree and pairCount:
+      handRank = 6
    elif isFlush:
       handRank = 5
    elif isStraight:
       handRank = 4
-   elif 3 in rankCounts.values():
-      handRank = 3        
-   elif list(rankCounts.values()).count(2) == 2:
+   elif hasThree:
+      handRank = 3
+   elif pairCount == 2:
       handRank = 2
-   elif 2 in rankCounts.values():
-      handRank = 1      
+   elif pairCount:
+      handRank = 1
    else:
       handRank = 0
-   highCardValue = max(listOfRanks) # The highest ranking card in the hand
-   return (handRank, highCardValue)
\ No newline at end of file
+   highCardValue = rankMask.bit_length() + 1 # The highest ranking card in the hand
+   return (handRank, highCardValue)
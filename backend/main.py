@@ -6,9 +6,9 @@ Description: Command-line entry point that runs one or more PokerBot rounds.
 """
 
 from pathlib import Path
+import multiprocessing
+import os
 import sys
-from itertools import combinations
-from data_logger import PokerDataLogger
 import random
 
 # Ensure repository root is on sys.path so ml package imports resolve when running this file directly.
@@ -16,98 +16,150 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from deck import cardDeck, emptyDeckError
+from deck import cardDeck, joinCards
 from get_player_action import getPlayerAction
 from bot_decision_with_eval import botDecisionWithEval
-from hand_evaluator import evaluateHand
 from print_hands import printHands
-from data_logger import logGameResult
-from ml.predict_win_rate import predictWinRate
-
-HAND_RANK_LABELS = {
-    0: "High Card",
-    1: "One Pair",
-    2: "Two Pair",
-    3: "Three of a Kind",
-    4: "Straight",
-    5: "Flush",
-    6: "Full House",
-    7: "Four of a Kind",
-    8: "Straight Flush",
-    9: "Royal Flush",
-}
-
-def _best_hand_score(cards: list) -> tuple[int, int]:
-    """
-    Evaluate the strongest 5-card combination available and return (rank, high card).
-    """
-    if len(cards) <= 5:
-        return evaluateHand(list(cards))
+from data_logger import ROUND_COLUMNS, PokerDataLogger, logGameResult
+from ml.predict_win_rate import handScore, predictWinRatePair
+
+# POKERBOT_FAST=1 deals the whole board in one call when the flop comes out instead of
+# burning and drawing street by street (same cards, fewer calls per round). Combined
+# with a logging session it runs POKERBOT_ROUNDS bot-vs-bot rounds in parallel instead.
+FAST_MODE = bool(os.environ.get("POKERBOT_FAST"))
+SELF_PLAY_ROUNDS = int(os.environ.get("POKERBOT_ROUNDS", 10000))
+# Raises answered per street in self-play; two strong hands would otherwise re-raise forever.
+HEADLESS_MAX_RAISES = 3
+
+# Set to False to silence the reshuffle notice in long simulated runs.
+ANNOUNCE_RESHUFFLE = True
 
-    best_score = (-1, -1)
-    for combo in combinations(cards, 5):
-        combo_score = evaluateHand(list(combo))
-        if combo_score > best_score:
-            best_score = combo_score
-    return best_score
+# Round narration goes through _log so batch callers can run play_round without
+# paying for stdout. Toggle with set_verbose().
+VERBOSE = True
 
 
-def _compare_hands(player_cards: list, bot_cards: list) -> tuple[str, tuple[int, int], tuple[int, int]]:
+def _log(*args, **kwargs) -> None:
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+def set_verbose(enabled: bool) -> None:
+    """
+    Turn the per-round output of play_round on or off.
+    """
+    global VERBOSE
+    VERBOSE = bool(enabled)
+
+# Indexed by the hand category (0-9) the evaluator returns.
+HAND_RANK_LABELS = (
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+    "Royal Flush",
+)
+
+# Showdown result labels indexed by the sign of (player score - bot score) + 1.
+_WINNER_LABELS = ("Bot", "Tie", "Player")
+
+# Postflop streets in deal order, with the number of cards each one adds to the board.
+STREETS = (("Flop", 3), ("Turn", 1), ("River", 1))
+STREET_NAMES = tuple(name for name, _ in STREETS)
+
+
+def _compare_hands(player_bits: int, bot_bits: int) -> tuple[str, tuple[int, int], tuple[int, int]]:
     """
-    Determine the winner between the player and bot card pools.
+    Determine the winner between the player and bot card pools, given as 52-bit card sets.
 
     Returns:
         tuple: (winner label, player score tuple, bot score tuple)
     """
-    player_score = _best_hand_score(player_cards)
-    bot_score = _best_hand_score(bot_cards)
+    player_score = handScore(player_bits)
+    bot_score = handScore(bot_bits)
 
-    if player_score > bot_score:
-        return "Player", player_score, bot_score
-    if player_score < bot_score:
-        return "Bot", player_score, bot_score
-    return "Tie", player_score, bot_score
+    # -1 / 0 / +1 for bot ahead / tie / player ahead, shifted into _WINNER_LABELS.
+    outcome = (player_score > bot_score) - (player_score < bot_score)
+    return _WINNER_LABELS[outcome + 1], player_score, bot_score
 
 
-def _format_action(action: tuple[str, float]) -> str:
-    actionName, amount = action
-    if actionName == "RAISE" and amount:
-        return f"{actionName} {amount}"
-    return actionName
+# "RAISE <amount>" labels, built once per amount. Both the player and the bot raise
+# by whole-chip ints, so the amount alone is the key.
+_ACTION_CACHE: dict[int, str] = {}
+
+
+def _format_action(actionName: str, amount: float) -> str:
+    """
+    Return the display label for an action: the bare name for FOLD, CALL and a zero
+    raise, otherwise "RAISE <amount>", cached per amount in _ACTION_CACHE.
+    """
+    if not amount or actionName != "RAISE":
+        return actionName
+    label = _ACTION_CACHE.get(amount)
+    if label is None:
+        label = _ACTION_CACHE[amount] = f"RAISE {amount}"
+    return label
+
+
+def _reshuffle(deck: cardDeck) -> None:
+    """
+    Refill and reshuffle a deck that ran short mid-round.
+    """
+    if ANNOUNCE_RESHUFFLE:
+        _log("Deck empty — reshuffling...")
+    deck.reset()
 
 
 def safe_draw(deck: cardDeck, n: int = 1):
     """
     Draw cards from the deck, reshuffling if the deck runs out mid-game.
     """
-    try:
-        return deck.draw(n)
-    except emptyDeckError:
+    if len(deck) < n:
         # An empty deck mid-round just means we reshuffle and continue play.
-        print("Deck empty — reshuffling...")
-        deck.reset()
-        return deck.draw(n)
+        _reshuffle(deck)
+    return deck.draw(n)
 
 
 def safe_burn(deck: cardDeck, n: int = 1) -> None:
     """
     Burn cards safely, reshuffling if the deck runs out mid-game.
     """
-    try:
-        deck.burn(n)
-    except emptyDeckError:
+    if len(deck) < n:
         # Mirror draw handling so a short deck never stops the round.
-        print("Deck empty — reshuffling...")
-        deck.reset()
-        deck.burn(n)
+        _reshuffle(deck)
+    deck.burn(n)
+
+
+def safe_deal_board(deck: cardDeck) -> list:
+    """
+    Burn and deal the full five-card board at once, reshuffling if the deck runs out.
+    """
+    if len(deck) < 8:
+        _reshuffle(deck)
+    return deck.dealBoard()
 
 
 def _print_board(stage: str, community_cards: list) -> None:
-    board_display = ", ".join(str(card) for card in community_cards) if community_cards else "[No Cards]"
-    print(f"{stage}: {board_display}")
+    board_display = joinCards(community_cards) if community_cards else "[No Cards]"
+    _log(f"{stage}: {board_display}")
 
 def _print_stacks_and_pot(playerBalance: int, botBalance: int, pot: int) -> None:
-    print(f"Stacks -> You: {playerBalance} | Bot: {botBalance} | Pot: {pot}")
+    _log(f"Stacks -> You: {playerBalance} | Bot: {botBalance} | Pot: {pot}")
+
+def _print_win_rates(playerBits: int, botBits: int, boardBits: int, seed: int | None = None) -> None:
+    # The estimates are only ever printed, so skip the Monte Carlo rollouts when quiet.
+    if not VERBOSE:
+        return
+    # A seeded round gives each street (0, 3, 4 or 5 board cards) its own rollout seed.
+    streetSeed = None if seed is None else seed + boardBits.bit_count()
+    playerWinRate, botWinRate = predictWinRatePair(playerBits, botBits, boardBits, streetSeed)
+    _log(f"Estimated player win rate: {playerWinRate:.2f}")
+    _log(f"Estimated bot win rate: {botWinRate:.2f}")
 
 
 def play_round(
@@ -116,20 +168,32 @@ def play_round(
     playerIsSmallBlind: bool,
     smallBlind: int = 5,
     bigBlind: int = 10,
+    deck: cardDeck | None = None,
+    seed: int | None = None,
 ) -> tuple[str, dict, int, int]:
     """
     Execute a single round of the CLI game with blinds, pot, and chip tracking.
 
+    Pass a deck to reuse it across rounds; it is reset and reshuffled here. Pass a
+    seed to replay a round: it seeds the shuffle, the bot's decisions and the win-rate
+    rollouts, without touching the random module's shared state. A seeded round deals
+    from its own deck, so a session deck passed alongside it is left untouched.
+
     Returns:
         winner (str)
         roundData (dict)
         updatedPlayerBalance (int)
         updatedBotBalance (int)
     """
-    deck = cardDeck()
-    deck.shuffle()
+    if deck is None or seed is not None:
+        # Reseeding the caller's deck would leave every later unseeded round replaying
+        # the continuation of this seed.
+        deck = cardDeck(seed)
+    deck.reset()
+    # The bot's decisions draw from their own generator when the round is seeded.
+    botRng = random if seed is None else random.Random(seed)
 
-    print("\n--- New Round ---")
+    _log("\n--- New Round ---")
 
     # --- round state ---
     pot = 0
@@ -144,20 +208,32 @@ def play_round(
     # Deal hole cards
     playerHand = safe_draw(deck, 2)
     botHand = safe_draw(deck, 2)
+    # The board only feeds printing and logging, so it stays a short list of Card
+    # objects; evaluation never concatenates it (see the card bitsets below).
     communityCards: list = []
 
+    # 52-bit card sets (hole cards plus board, see playingCard.bit) for the evaluator and
+    # win-rate estimates; each board card is OR-ed in as it is dealt, so no Card lists
+    # are re-concatenated per street.
+    playerBits = playerHand[0].bit | playerHand[1].bit
+    botBits = botHand[0].bit | botHand[1].bit
+    boardBits = 0
+    # The bot's decision reads Card objects, so its hole cards plus board are kept as one
+    # list that grows with the board instead of being rebuilt each street.
+    botCards = botHand + communityCards
+
     roundData = {}
     # Tracking vars for later logging
     playerActionStr = ""
     botActionStr = ""
-    playerFlopAction = botFlopAction = ""
-    playerTurnAction = botTurnAction = ""
-    playerRiverAction = botRiverAction = ""
+    # Postflop actions keyed by street name, filled in as each street is played
+    playerStreetActions = dict.fromkeys(STREET_NAMES, "")
+    botStreetActions = dict.fromkeys(STREET_NAMES, "")
 
     # --- Post blinds and decide who acts first preflop ---
     if playerIsSmallBlind:
         # Player SB, Bot BB
-        print("This hand: You are SMALL BLIND (5). Bot is BIG BLIND (10).")
+        _log("This hand: You are SMALL BLIND (5). Bot is BIG BLIND (10).")
         sbAmount = min(smallBlind, playerBalance)
         bbAmount = min(bigBlind, botBalance)
 
@@ -171,7 +247,7 @@ def play_round(
         firstToAct = "player"
     else:
         # Bot SB, Player BB
-        print("This hand: Bot is SMALL BLIND (5). You are BIG BLIND (10).")
+        _log("This hand: Bot is SMALL BLIND (5). You are BIG BLIND (10).")
         sbAmount = min(smallBlind, botBalance)
         bbAmount = min(bigBlind, playerBalance)
 
@@ -184,15 +260,13 @@ def play_round(
 
         firstToAct = "bot"
 
-    printHands(playerHand, botHand, hideBot=True)
+    if VERBOSE:
+        printHands(playerHand, botHand, hideBot=True)
     _print_board("Board", communityCards)
     _print_stacks_and_pot(playerBalance, botBalance, pot)
 
-    # Show preflop win-rate estimates (hole cards only)
-    playerWinRate = predictWinRate(playerHand)
-    botWinRate = predictWinRate(botHand)
-    print(f"Estimated player win rate: {playerWinRate:.2f}")
-    print(f"Estimated bot win rate: {botWinRate:.2f}")
+    # Show preflop win-rate estimates (hole cards only, against a random opponent hand)
+    _print_win_rates(playerBits, botBits, boardBits, seed)
 
     # --- helper to award pot and finish immediately when somebody folds ---
     def _finish_on_fold(folder: str, stageWinner: str) -> tuple[str, dict, int, int]:
@@ -206,7 +280,7 @@ def play_round(
         potLocal = pot
         pot = 0
 
-        print(f"\n{folder} folded. {stageWinner} wins the pot of {potLocal} chips.")
+        _log(f"\n{folder} folded. {stageWinner} wins the pot of {potLocal} chips.")
         _print_stacks_and_pot(playerBalance, botBalance, pot)
 
         # Build minimal roundData for logging
@@ -219,12 +293,12 @@ def play_round(
             winner=stageWinner,
             playerScore=None,
             botScore=None,
-            playerFlopAction=playerFlopAction,
-            botFlopAction=botFlopAction,
-            playerTurnAction=playerTurnAction,
-            botTurnAction=botTurnAction,
-            playerRiverAction=playerRiverAction,
-            botRiverAction=botRiverAction,
+            playerFlopAction=playerStreetActions["Flop"],
+            botFlopAction=botStreetActions["Flop"],
+            playerTurnAction=playerStreetActions["Turn"],
+            botTurnAction=botStreetActions["Turn"],
+            playerRiverAction=playerStreetActions["River"],
+            botRiverAction=botStreetActions["River"],
         )
 
         # Also log to hands.csv (existing function)
@@ -256,16 +330,16 @@ def play_round(
 
         if actor == "player":
             # No more preflop text here, important for raise logic
-            print(f"Amount to call: {amountToCall} | Your stack: {balance} | Pot: {pot}")
+            _log(f"Amount to call: {amountToCall} | Your stack: {balance} | Pot: {pot}")
             actionName, raiseAmount = getPlayerAction()
         else:
             # Bot uses eval; if cardsForBotDecision provided, use it.
             if cardsForBotDecision is None:
                 cardsForBotDecision = botHand
-            actionName, raiseAmount = botDecisionWithEval(cardsForBotDecision)
+            actionName, raiseAmount = botDecisionWithEval(cardsForBotDecision, botRng)
 
-        actionStr = _format_action((actionName, raiseAmount))
-        print(f"{'You' if actor=='player' else 'Bot'} chose: {actionStr}")
+        actionStr = _format_action(actionName, raiseAmount)
+        _log(f"{'You' if actor=='player' else 'Bot'} chose: {actionStr}")
 
         if actionName == "FOLD":
             return actionStr, balance, committed, True
@@ -303,7 +377,7 @@ def play_round(
             # How much this actor needs to match
             if actor == "player":
                 amountToCall = max(0, botCommitted - playerCommitted)
-                print("\n--- Your response to raise ---")
+                _log("\n--- Your response to raise ---")
                 actionStr, playerBalance, playerCommitted, folded = _take_action(
                     "player", amountToCall, playerBalance, playerCommitted
                 )
@@ -314,7 +388,7 @@ def play_round(
 
             else:
                 amountToCall = max(0, playerCommitted - botCommitted)
-                print("\n--- Bot responds to raise ---")
+                _log("\n--- Bot responds to raise ---")
                 actionStr, botBalance, botCommitted, folded = _take_action(
                     "bot", amountToCall, botBalance, botCommitted
                 )
@@ -393,126 +467,68 @@ def play_round(
                 if result is not None:
                     return result
 
-    print("\n--- End of Preflop Betting ---")
+    _log("\n--- End of Preflop Betting ---")
     _print_stacks_and_pot(playerBalance, botBalance, pot)
 
     # From here on, we keep betting much simpler: 1 action each per street, still
     # ending the hand immediately if someone folds.
-
-    # ------------- FLOP -------------
-    safe_burn(deck)
-    communityCards.extend(safe_draw(deck, 3))
-    print("\n-- Flop --")
-    _print_board("Flop", communityCards)
-
-    playerWinRate = predictWinRate(playerHand + communityCards)
-    botWinRate = predictWinRate(botHand + communityCards)
-    print(f"Estimated player win rate: {playerWinRate:.2f}")
-    print(f"Estimated bot win rate: {botWinRate:.2f}")
-
-    playerCommitted = botCommitted = 0  # reset street bets
-
-    # Player acts first on postflop in this simple model
-    print("\n--- Your turn (Flop) ---")
-    print(f"Your stack: {playerBalance} | Pot: {pot}")
-    actionName, raiseAmt = getPlayerAction()
-    playerFlopAction = _format_action((actionName, raiseAmt))
-    print(f"You chose: {playerFlopAction}")
-
-    if actionName == "FOLD":
-        return _finish_on_fold("Player", "Bot")
-
-    if actionName == "CALL":
-        # Simple "check/call": no extra bet if nobody bet
-        pass
-    elif actionName == "RAISE":
-        toPut = min(raiseAmt, playerBalance)
-        playerBalance -= toPut
-        pot += toPut
-        playerCommitted += toPut
-        # NEW raise logic
-        result = resolve_raise_loop("player")
-        if result is not None:
-            return result
-
-    # Loop ended with CALL -> flop betting done
-        print("\n--- End of Flop Betting ---")
-        _print_stacks_and_pot(playerBalance, botBalance, pot)
-
-    # NEW if player did NOT raise do we give bot a single normal action:
-    if actionName != "RAISE":
-
-        print("\n--- Bot turn (Flop) ---")
-        actionName, raiseAmt = botDecisionWithEval(botHand + communityCards)
-        botFlopAction = _format_action((actionName, raiseAmt))
-        print(f"Bot action: {botFlopAction}")
+    def _run_street(street: str, newCards: list):
+        """
+        Add one street's cards to the board and run its betting: the player acts first,
+        the bot answers unless the player raised, and any raise goes to the raise loop.
+        Returns:
+            None if hand continues,
+            OR a finished-round tuple if someone folds.
+        """
+        nonlocal playerBalance, botBalance, pot
+        nonlocal playerCommitted, botCommitted
+        nonlocal playerBits, botBits, boardBits
+
+        communityCards.extend(newCards)
+        streetBits = 0
+        for card in newCards:
+            streetBits |= card.bit
+        playerBits |= streetBits
+        botBits |= streetBits
+        boardBits |= streetBits
+        botCards.extend(newCards)
+        _log(f"\n-- {street} --")
+        _print_board(street, communityCards)
+
+        _print_win_rates(playerBits, botBits, boardBits, seed)
+
+        playerCommitted = botCommitted = 0  # reset street bets
+
+        # Player acts first on postflop in this simple model
+        _log(f"\n--- Your turn ({street}) ---")
+        _log(f"Your stack: {playerBalance} | Pot: {pot}")
+        actionName, raiseAmt = getPlayerAction()
+        playerStreetActions[street] = _format_action(actionName, raiseAmt)
+        _log(f"You chose: {playerStreetActions[street]}")
 
         if actionName == "FOLD":
-            return _finish_on_fold("Bot", "Player")
+            return _finish_on_fold("Player", "Bot")
 
-        if actionName == "CALL":
-            if playerCommitted > 0:
-                toPut = min(playerCommitted, botBalance)
-                botBalance -= toPut
-                pot += toPut
-                botCommitted += toPut
-        elif actionName == "RAISE":
-            # Bot raises on top of whatever you put in (if anything)
-            base = playerCommitted
-            extra = raiseAmt
-            toPut = min(base + extra, botBalance)
-            botBalance -= toPut
+        # A player CALL is a simple "check/call": no extra bet if nobody bet
+        if actionName == "RAISE":
+            toPut = min(raiseAmt, playerBalance)
+            playerBalance -= toPut
             pot += toPut
-            botCommitted += toPut
-            # NEW raise logic
-            result = resolve_raise_loop("bot")
+            playerCommitted += toPut
+            result = resolve_raise_loop("player")
             if result is not None:
                 return result
-            print("\n--- End of Flop Betting ---")
-            _print_stacks_and_pot(playerBalance, botBalance, pot)
-
-    # ------------- TURN -------------
-    safe_burn(deck)
-    communityCards.append(safe_draw(deck))
-    print("\n-- Turn --")
-    _print_board("Turn", communityCards)
-
-    playerWinRate = predictWinRate(playerHand + communityCards)
-    botWinRate = predictWinRate(botHand + communityCards)
-    print(f"Estimated player win rate: {playerWinRate:.2f}")
-    print(f"Estimated bot win rate: {botWinRate:.2f}")
-
-    playerCommitted = botCommitted = 0
-
-    print("\n--- Your turn (Turn) ---")
-    print(f"Your stack: {playerBalance} | Pot: {pot}")
-    actionName, raiseAmt = getPlayerAction()
-    playerTurnAction = _format_action((actionName, raiseAmt))
-    print(f"You chose: {playerTurnAction}")
-
-    if actionName == "FOLD":
-        return _finish_on_fold("Player", "Bot")
-
-    if actionName == "RAISE":
-        toPut = min(raiseAmt, playerBalance)
-        playerBalance -= toPut
-        pot += toPut
-        playerCommitted += toPut
-         # NEW raise logic
-        result = resolve_raise_loop("player")
-        if result is not None:
-            return result
-
-    # Loop ended with CALL -> Turn betting done
-        print("\n--- End of Turn Betting ---")
-        _print_stacks_and_pot(playerBalance, botBalance, pot)
 
-    if actionName !="RAISE":
+            # Loop ended with CALL -> street betting done
+            _log(f"\n--- End of {street} Betting ---")
+            _print_stacks_and_pot(playerBalance, botBalance, pot)
+            return None
 
-        print("\n--- Bot turn (Turn) ---")
-        actionName, raiseAmt = botDecisionWithEval(botHand + communityCards)
-        botTurnAction = _format_action((actionName, raiseAmt))
-        print(f"Bot action: {botTurnAction}")
+        # Player did NOT raise, so the bot gets a single normal action
+        _log(f"\n--- Bot turn ({street}) ---")
+        actionName, raiseAmt = botDecisionWithEval(botCards, botRng)
+        botStreetActions[street] = _format_action(actionName, raiseAmt)
+        _log(f"Bot action: {botStreetActions[street]}")
 
         if actionName == "FOLD":
             return _finish_on_fold("Bot", "Player")
@@ -524,102 +540,43 @@ def play_round(
                 pot += toPut
                 botCommitted += toPut
         elif actionName == "RAISE":
-            base = playerCommitted
-            extra = raiseAmt
-            toPut = min(base + extra, botBalance)
+            # Bot raises on top of whatever you put in (if anything)
+            toPut = min(playerCommitted + raiseAmt, botBalance)
             botBalance -= toPut
             pot += toPut
             botCommitted += toPut
-            # NEW raise logic
             result = resolve_raise_loop("bot")
             if result is not None:
                 return result
-
-    # Loop ended with CALL -> Turn betting done
-            print("\n--- End of Turn Betting ---")
+            _log(f"\n--- End of {street} Betting ---")
             _print_stacks_and_pot(playerBalance, botBalance, pot)
-
-    # ------------- RIVER -------------
-    safe_burn(deck)
-    communityCards.append(safe_draw(deck))
-    print("\n-- River --")
-    _print_board("River", communityCards)
-
-    playerWinRate = predictWinRate(playerHand + communityCards)
-    botWinRate = predictWinRate(botHand + communityCards)
-    print(f"Estimated player win rate: {playerWinRate:.2f}")
-    print(f"Estimated bot win rate: {botWinRate:.2f}")
-
-    playerCommitted = botCommitted = 0
-
-    print("\n--- Your turn (River) ---")
-    print(f"Your stack: {playerBalance} | Pot: {pot}")
-    actionName, raiseAmt = getPlayerAction()
-    playerRiverAction = _format_action((actionName, raiseAmt))
-    print(f"You chose: {playerRiverAction}")
-
-    if actionName == "FOLD":
-        return _finish_on_fold("Player", "Bot")
-
-    if actionName == "RAISE":
-        toPut = min(raiseAmt, playerBalance)
-        playerBalance -= toPut
-        pot += toPut
-        playerCommitted += toPut
-        # NEW raise logic
-        result = resolve_raise_loop("player")
+        return None
+
+    # ------------- FLOP / TURN / RIVER -------------
+    for street, count in STREETS:
+        if FAST_MODE:
+            # The whole board comes out with the flop; later streets just reveal it.
+            if not communityCards:
+                fullBoard = safe_deal_board(deck)
+            dealt = len(communityCards)
+            newCards = fullBoard[dealt:dealt + count]
+        else:
+            safe_burn(deck)
+            newCards = safe_draw(deck, count) if count > 1 else [safe_draw(deck)]
+        result = _run_street(street, newCards)
         if result is not None:
             return result
 
-    # Loop ended with CALL -> River betting done
-        print("\n--- End of River Betting ---")
-        _print_stacks_and_pot(playerBalance, botBalance, pot)
-
-
-    if actionName !="RAISE":   
-        print("\n--- Bot turn (River) ---")
-        actionName, raiseAmt = botDecisionWithEval(botHand + communityCards)
-        botRiverAction = _format_action((actionName, raiseAmt))
-        print(f"Bot action: {botRiverAction}")
-
-        if actionName == "FOLD":
-            return _finish_on_fold("Bot", "Player")
-
-        if actionName == "CALL":
-            if playerCommitted > 0:
-                toPut = min(playerCommitted, botBalance)
-                botBalance -= toPut
-                pot += toPut
-                botCommitted += toPut
-        elif actionName == "RAISE":
-            base = playerCommitted
-            extra = raiseAmt
-            toPut = min(base + extra, botBalance)
-            botBalance -= toPut
-            pot += toPut
-            botCommitted += toPut
-             # NEW raise logic
-            result = resolve_raise_loop("bot")
-            if result is not None:
-                return result
-
-    # Loop ended with CALL -> River betting done
-            print("\n--- End of River Betting ---")
-            _print_stacks_and_pot(playerBalance, botBalance, pot)
-
-
     # ------------- SHOWDOWN -------------
 
-    winner, playerScore, botScore = _compare_hands(
-        playerHand + communityCards,
-        botHand + communityCards,
-    )
+    winner, playerScore, botScore = _compare_hands(playerBits, botBits)
 
-    print("\n-- Showdown --")
-    printHands(playerHand, botHand, hideBot=False)
+    _log("\n-- Showdown --")
+    if VERBOSE:
+        printHands(playerHand, botHand, hideBot=False)
     _print_board("Board", communityCards)
-    print(f"Player hand rank: {HAND_RANK_LABELS.get(playerScore[0], 'Unknown')}")
-    print(f"Bot hand rank: {HAND_RANK_LABELS.get(botScore[0], 'Unknown')}")
+    _log(f"Player hand rank: {HAND_RANK_LABELS[playerScore[0]]}")
+    _log(f"Bot hand rank: {HAND_RANK_LABELS[botScore[0]]}")
 
     # Award pot to winner (split on tie is left as an easy extension)
     if winner == "Player":
@@ -627,7 +584,7 @@ def play_round(
     elif winner == "Bot":
         botBalance += pot
 
-    print(f"Round winner: {winner}")
+    _log(f"Round winner: {winner}")
     _print_stacks_and_pot(playerBalance, botBalance, 0)
 
     logGameResult(
@@ -648,16 +605,22 @@ def play_round(
         winner,
         playerScore,
         botScore,
-        playerFlopAction,
-        botFlopAction,
-        playerTurnAction,
-        botTurnAction,
-        playerRiverAction,
-        botRiverAction,
+        playerStreetActions["Flop"],
+        botStreetActions["Flop"],
+        playerStreetActions["Turn"],
+        botStreetActions["Turn"],
+        playerStreetActions["River"],
+        botStreetActions["River"],
     )
 
     return winner, roundData, playerBalance, botBalance
 
+# Every round row has the same ROUND_COLUMNS keys, so _build_round_data copies this
+# pre-keyed dict and fills it in ("Player Balance" stays blank) instead of building a
+# fresh 14-key dict literal per round.
+_ROUND_TEMPLATE = dict.fromkeys(ROUND_COLUMNS, "")
+
+
 def _build_round_data(
     playerHand: list,
     botHand: list,
@@ -696,30 +659,102 @@ def _build_round_data(
     Returns:
         dict: A single row of round data for logging.
     """
-    playerStrength = HAND_RANK_LABELS.get(playerScore[0], "Unknown") if playerScore else ""
-    botStrength = HAND_RANK_LABELS.get(botScore[0], "Unknown") if botScore else ""
-
-    roundData = {
-        "Player Hand": ", ".join(str(card) for card in playerHand),
-        "Bot Hand": ", ".join(str(card) for card in botHand),
-        "Player Strength": playerStrength,
-        "Bot Strength": botStrength,
-        "Player Preflop Action": playerPreflopAction,
-        "Bot Preflop Action": botPreflopAction,
-        "Player Flop Action": playerFlopAction,
-        "Bot Flop Action": botFlopAction,
-        "Player Turn Action": playerTurnAction,
-        "Bot Turn Action": botTurnAction,
-        "Player River Action": playerRiverAction,
-        "Bot River Action": botRiverAction,
-        "Player Balance": "",
-        "Winner": winner,
-    }
+    playerStrength = HAND_RANK_LABELS[playerScore[0]] if playerScore else ""
+    botStrength = HAND_RANK_LABELS[botScore[0]] if botScore else ""
+
+    roundData = _ROUND_TEMPLATE.copy()
+    roundData["Player Hand"] = joinCards(playerHand)
+    roundData["Bot Hand"] = joinCards(botHand)
+    roundData["Player Strength"] = playerStrength
+    roundData["Bot Strength"] = botStrength
+    roundData["Player Preflop Action"] = playerPreflopAction
+    roundData["Bot Preflop Action"] = botPreflopAction
+    roundData["Player Flop Action"] = playerFlopAction
+    roundData["Bot Flop Action"] = botFlopAction
+    roundData["Player Turn Action"] = playerTurnAction
+    roundData["Bot Turn Action"] = botTurnAction
+    roundData["Player River Action"] = playerRiverAction
+    roundData["Bot River Action"] = botRiverAction
+    roundData["Winner"] = winner
 
     return roundData
 
 
 
+def play_round_headless(seed: int) -> dict:
+    """
+    Play one bot-vs-bot round with no prompts or output, for self-play logging.
+
+    Both seats act once per street with botDecisionWithEval, and a raise is answered
+    by the other seat (up to HEADLESS_MAX_RAISES raises per street). Which seat opens
+    each street alternates with the seed's parity, so neither seat is systematically
+    first to fold. A fold ends the round, otherwise the hands are compared at showdown.
+    Chip stacks are not tracked.
+
+    Parameters:
+        seed (int): Seed for this round's shuffle and bot decisions, so a round can be replayed.
+
+    Returns:
+        dict: One row of round data for PokerDataLogger.appendRound.
+    """
+    rng = random.Random(seed)
+    deck = cardDeck(seed)
+    deck.reset()
+    playerHand = deck.draw(2)
+    botHand = deck.draw(2)
+    board = deck.dealBoard()
+    hands = (playerHand, botHand)
+    seatOrder = (0, 1) if seed % 2 == 0 else (1, 0)
+
+    # Player then bot action for preflop, flop, turn and river; a seat's latest action
+    # on a street replaces its earlier one, as in play_round's raise loop.
+    actions = ["", "", "", "", "", "", "", ""]
+    communityCards: list = []
+    for street, boardSize in enumerate((0, 3, 4, 5)):
+        communityCards = board[:boardSize]
+        toAct = list(seatOrder)
+        raises = 0
+        while toAct:
+            seat = toAct.pop(0)
+            actionName, raiseAmt = botDecisionWithEval(hands[seat] + communityCards, rng)
+            actions[2 * street + seat] = _format_action(actionName, raiseAmt)
+            if actionName == "FOLD":
+                winner = "Bot" if seat == 0 else "Player"
+                return _build_round_data(playerHand, botHand, communityCards, actions[0], actions[1], winner, None, None, *actions[2:])
+            if actionName == "RAISE" and raises < HEADLESS_MAX_RAISES:
+                raises += 1
+                # Whoever has not just raised must answer it before the street ends.
+                toAct = [1 - seat]
+
+    boardBits = 0
+    for card in board:
+        boardBits |= card.bit
+    winner, playerScore, botScore = _compare_hands(
+        playerHand[0].bit | playerHand[1].bit | boardBits,
+        botHand[0].bit | botHand[1].bit | boardBits,
+    )
+    return _build_round_data(playerHand, botHand, communityCards, actions[0], actions[1], winner, playerScore, botScore, *actions[2:])
+
+
+def _run_self_play(logger: PokerDataLogger, rounds: int) -> None:
+    """
+    Play `rounds` headless rounds across every core and log each one.
+
+    Rounds are independent, so workers return finished rows and only this process
+    touches the logger. Under the fork start method workers inherit the evaluator
+    tables; under spawn each worker re-imports this module and builds them once.
+    """
+    print(f"Self-play: logging {rounds} rounds to {logger.filePath}...")
+    firstSeed = random.randrange(1 << 30)
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for roundData in pool.imap_unordered(
+            play_round_headless, range(firstSeed, firstSeed + rounds), chunksize=256
+        ):
+            logger.appendRound(roundData)
+    logger.close()
+    print("Self-play finished.")
+
+
 def main():
     """
     Entry point for PokerBot CLI.
@@ -729,9 +764,14 @@ def main():
     print("Starting PokerBot CLI. Press Ctrl+C to exit.")
 
     # Prompt user to enable logging (existing behavior)
-    enableLogging = input("Would you like to start a logging session? [y/N]: ").strip().lower() == "y"
+    enableLogging = input("Would you like to start a logging session? [y/N]: ").strip().lower() in ("y", "yes")
     logger = PokerDataLogger(enableLogging=enableLogging)
 
+    if FAST_MODE and enableLogging:
+        # Unattended run for training data: no prompts, rounds spread over all cores.
+        _run_self_play(logger, SELF_PLAY_ROUNDS)
+        return
+
     # --- NEW: chip stacks + blinds + starting position ---
     playerBalance = 1000
     botBalance = 1000
@@ -743,6 +783,15 @@ def main():
     # False -> bot is small blind / acts first
     playerIsSmallBlind = random.choice([True, False])
 
+    # One deck for the whole session; play_round resets it at the start of every hand.
+    deck = cardDeck()
+
+    # The evaluator tables (and the optional C extension) load at import, but the Numba
+    # kernel behind predictWinRatePair compiles on its first call (a few seconds with a
+    # cold cache). Run one estimate now so the first hand does not stall.
+    if VERBOSE:
+        predictWinRatePair(0b0011, 0b1100, 0)
+
     try:
         while True:
             print("\n====================================")
@@ -757,13 +806,14 @@ def main():
                 playerIsSmallBlind=playerIsSmallBlind,
                 smallBlind=SMALL_BLIND,
                 bigBlind=BIG_BLIND,
+                deck=deck,
             )
 
             # Persist player's ending balance into the logging row
             roundData["Player Balance"] = playerBalance
 
             # Append one row of round data if logging is enabled
-            if enableLogging:
+            if logger.enableLogging:
                 logger.appendRound(roundData)
 
             print("------------------------------------")
@@ -5,6 +5,8 @@ Created: 10/18/2025
 Description: Displays the player's and bot's cards in the terminal in a readable format after each round.
 """
 
+from deck import joinCards
+
 def printHands(playerHand: list, botHand: list, hideBot: bool = False):
    """
    Displays the player's and bot's cards in the terminal in a readable format after each round.
@@ -17,8 +19,8 @@ def printHands(playerHand: list, botHand: list, hideBot: bool = False):
    Returns:
       None
    """    
-   print("Your hand:", ", ".join(str(card) for card in playerHand))   
+   print("Your hand:", joinCards(playerHand))   
    if hideBot:
       print("Bot hand: [Hidden Card], [Hidden Card]")
    else:
-      print("Bot hand:", ", ".join(str(card) for card in botHand))
+      print("Bot hand:", joinCards(botHand))
@@ -0,0 +1,70 @@
+/*
+ * File: _phe.c
+ * Author: Jacob Silva
+ * Created: 10/15/2026
+ * Description: C scoring of 5-7 card hands with the Cactus Kev seven-card tables built in
+ *              backend/hand_evaluator.py. Bound through CFFI by _phe_build.py as ml._phe_cffi.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+static const uint16_t *flush7;        /* best flush rank by 13-bit rank mask */
+static const int64_t *unsuitedKeys;   /* sorted prime products */
+static const uint16_t *unsuitedRanks; /* rank for each entry of unsuitedKeys */
+static size_t unsuitedCount;
+static uint32_t deckCodes[52];        /* card int for each bit of an eval7 bitset */
+
+void phe_init(const uint16_t *flush, const int64_t *keys, const uint16_t *ranks,
+              size_t count, const uint32_t *codes)
+{
+    flush7 = flush;
+    unsuitedKeys = keys;
+    unsuitedRanks = ranks;
+    unsuitedCount = count;
+    for (int i = 0; i < 52; i++)
+        deckCodes[i] = codes[i];
+}
+
+static uint16_t lookupUnsuited(int64_t product)
+{
+    size_t lo = 0, hi = unsuitedCount;
+    while (lo < hi) {
+        size_t mid = (lo + hi) >> 1;
+        if (unsuitedKeys[mid] < product)
+            lo = mid + 1;
+        else
+            hi = mid;
+    }
+    return unsuitedRanks[lo];
+}
+
+uint16_t eval_codes(const uint32_t *codes, int n)
+{
+    int64_t product = 1;
+    uint32_t suitRanks[4] = {0, 0, 0, 0};
+
+    for (int i = 0; i < n; i++) {
+        uint32_t code = codes[i];
+        product *= code & 0xFF;
+        /* Suit flags are 0x1000..0x8000; ctz of the flag nibble picks the suit. */
+        suitRanks[__builtin_ctz(code >> 12)] |= code >> 16;
+    }
+    for (int s = 0; s < 4; s++) {
+        if (__builtin_popcount(suitRanks[s]) >= 5)
+            return flush7[suitRanks[s]];
+    }
+    return lookupUnsuited(product);
+}
+
+uint16_t eval7(uint64_t bitset)
+{
+    uint32_t codes[7];
+    int n = 0;
+
+    while (bitset && n < 7) {
+        codes[n++] = deckCodes[__builtin_ctzll(bitset)];
+        bitset &= bitset - 1;
+    }
+    return eval_codes(codes, n);
+}
@@ -0,0 +1,32 @@
+"""
+File: _phe_build.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: CFFI build script for the optional C hand evaluator (ml/_phe.c).
+             Run from the repository root: python ml/_phe_build.py
+"""
+
+from pathlib import Path
+
+from cffi import FFI
+
+ML_DIR = Path(__file__).resolve().parent
+
+ffibuilder = FFI()
+ffibuilder.cdef(
+    """
+    void phe_init(const uint16_t *flush, const int64_t *keys, const uint16_t *ranks,
+                  size_t count, const uint32_t *codes);
+    uint16_t eval_codes(const uint32_t *codes, int n);
+    uint16_t eval7(uint64_t bitset);
+    """
+)
+ffibuilder.set_source(
+    "ml._phe_cffi",
+    (ML_DIR / "_phe.c").read_text(),
+    extra_compile_args=["-O3"],
+)
+
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=str(ML_DIR.parent), verbose=False)
@@ -2,58 +2,95 @@
 File: predict_win_rate.py
 Author: Jacob Silva
 Created: 11/04/2025
-Description: Placeholder ML model for estimating win probability based on hand strength.
+Description: Win-probability estimates (Monte Carlo rollouts) and hand scoring on 52-bit card sets.
 """
 
-from itertools import combinations
+import numpy as np
 
-from backend.hand_evaluator import evaluateHand  # matches your repo naming style
+# The backend modules are imported by their top-level names, the same names main.py
+# uses, so the lookup tables are shared with the game instead of being built a second
+# time. Entry points put backend/ on sys.path (main.py runs from it; tests/conftest.py
+# adds it); importing this module never changes the path itself.
+from deck import BIT_CODES, bitsToCodes
+from _eval_jit import mcEquity
+from hand_evaluator import (
+    evaluateCodes, HAND_CATEGORY, HAND_HIGH,
+    FLUSH7_LOOKUP_ARRAY, UNSUITED7_KEYS, UNSUITED7_RANKS,
+)
 
+# Optional C evaluator (build with `python ml/_phe_build.py`); the pure-Python
+# lookup in hand_evaluator is used when the extension has not been compiled.
+try:
+    from ml._phe_cffi import ffi as _phe_ffi, lib as _phe_lib
+except ImportError:
+    _phe_lib = None
+else:
+    # The tables are module globals in hand_evaluator, so they outlive every C read;
+    # eval7 bitsets use the same card order as playingCard.bit.
+    _PHE_CODES = np.array(BIT_CODES, dtype=np.uint32)
+    _phe_lib.phe_init(
+        _phe_ffi.from_buffer("uint16_t[]", FLUSH7_LOOKUP_ARRAY),
+        _phe_ffi.from_buffer("int64_t[]", UNSUITED7_KEYS),
+        _phe_ffi.from_buffer("uint16_t[]", UNSUITED7_RANKS),
+        len(UNSUITED7_KEYS),
+        _phe_ffi.from_buffer("uint32_t[]", _PHE_CODES),
+    )
 
-def _best_hand_score(cards: list) -> tuple[int, int]:
-    """
-    Evaluate the strongest 5-card combination available and return (rank, high card).
+
+# Rollouts per predictWinRatePair estimate; preflop has more unknown cards to average over.
+PREFLOP_TRIALS = 500
+POSTFLOP_TRIALS = 200
+
+
+def predictWinRatePair(
+    player_bits: int, bot_bits: int, board_bits: int, seed: int | None = None
+) -> tuple[float, float]:
     """
-    if len(cards) <= 5:
-        return evaluateHand(list(cards))
+    Estimate both players' win rates for the same street by Monte Carlo rollouts.
+
+    Each side's hole cards are played against a random opponent hand over random
+    completions of the board (PREFLOP_TRIALS before the flop, POSTFLOP_TRIALS after),
+    so neither estimate peeks at the other player's cards.
 
-    best_score = (-1, -1)
-    for combo in combinations(cards, 5):
-        combo_score = evaluateHand(list(combo))
-        if combo_score > best_score:
-            best_score = combo_score
-    return best_score
+    Parameters:
+        player_bits (int): 52-bit set (playingCard.bit) of the player's hole cards plus board.
+        bot_bits (int): 52-bit set of the bot's hole cards plus board.
+        board_bits (int): 52-bit set of the community cards dealt so far.
+        seed (int | None): Non-negative seed to make the estimates repeatable.
+
+    Returns:
+        tuple[float, float]: (player win rate, bot win rate), ties counting half.
+
+    Raises:
+        ValueError: If the board holds more than five cards, or either side does not
+            hold exactly two hole cards once the board is taken out.
+    """
+    # mcEquity fills fixed 2- and 5-card buffers in nopython mode, where indexing is not
+    # bounds-checked, so bad card counts must be caught before the call.
+    if board_bits.bit_count() > 5:
+        raise ValueError(f"Board must hold at most 5 cards, got {board_bits.bit_count()}.")
+    for name, bits in (("player", player_bits), ("bot", bot_bits)):
+        if bits & board_bits != board_bits or (bits ^ board_bits).bit_count() != 2:
+            raise ValueError(f"The {name}'s cards must be 2 hole cards plus the board.")
+    trials = POSTFLOP_TRIALS if board_bits else PREFLOP_TRIALS
+    # The bot's rollouts continue the stream the player's seeded, so one seed fixes both.
+    return (
+        mcEquity(player_bits ^ board_bits, board_bits, trials, -1 if seed is None else seed),
+        mcEquity(bot_bits ^ board_bits, board_bits, trials, -1),
+    )
 
 
-def predictWinRate(cards: list) -> float:
+def handScore(bits: int) -> tuple[int, int]:
     """
-    Placeholder for ML-based win rate prediction.
+    Score a 52-bit card set (playingCard.bit) the way evaluateCodes scores card ints.
 
     Parameters:
-        cards (list): playingCard objects available to the player (hole cards plus any community cards).
+        bits (int): 52-bit set of the cards held.
 
     Returns:
-        float: Heuristic win rate between 0.05 and 0.99.
+        tuple[int, int]: (hand category 0-9, high card value 2-14).
     """
-    strength, high_card = _best_hand_score(cards)
-
-    # Deterministic heuristic mapping covering every hand rank
-    rank_to_rate = {
-        0: 0.18,  # High Card
-        1: 0.28,  # Pair
-        2: 0.38,  # Two Pair
-        3: 0.48,  # Three of a Kind
-        4: 0.60,  # Straight
-        5: 0.70,  # Flush
-        6: 0.80,  # Full House
-        7: 0.88,  # Four of a Kind
-        8: 0.94,  # Straight Flush
-        9: 0.97,  # Royal Flush
-    }
-
-    base_rate = rank_to_rate.get(strength, 0.5)
-    kicker_adjust = max(0, min(1, (high_card - 2) / 12)) * 0.04  # subtle boost for higher cards
-    win_rate = base_rate + kicker_adjust
-
-    # Clamp to a sane range to avoid certainty claims
-    return max(0.05, min(win_rate, 0.99))
+    if _phe_lib is not None and 5 <= bits.bit_count() <= 7:
+        rank = _phe_lib.eval7(bits)
+        return HAND_CATEGORY[rank], HAND_HIGH[rank]
+    return evaluateCodes(bitsToCodes(bits))
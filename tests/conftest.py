@@ -0,0 +1,12 @@
+"""
+Put backend/ (imported by top-level module names, as main.py does) and the repository
+root (for the ml package) on sys.path for the test suite.
+"""
+
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+for path in (ROOT_DIR / "backend", ROOT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,124 @@
+"""
+File: test_data_logger.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: Tests for PokerDataLogger's background writer thread.
+"""
+
+import atexit
+import csv
+import time
+
+import pytest
+
+import data_logger
+from data_logger import ROUND_COLUMNS, PokerDataLogger
+
+
+def _row(index: int) -> list:
+    return [f"{column} {index}" for column in ROUND_COLUMNS]
+
+
+def _read_rows(logger: PokerDataLogger) -> list:
+    with open(logger.filePath, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+class RecordingWriter:
+    """Stands in for the csv writer and records the size of every batch written."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.batchSizes = []
+
+    def writerows(self, rows):
+        self.batchSizes.append(len(rows))
+        self.writer.writerows(rows)
+
+
+class FailingWriter:
+    def writerows(self, rows):
+        raise OSError("disk full")
+
+
+@pytest.fixture
+def logger(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # the log file goes under ./data
+    created = []
+
+    def makeLogger(**kwargs):
+        created.append(PokerDataLogger(enableLogging=True, **kwargs))
+        return created[-1]
+
+    yield makeLogger
+    for each in created:
+        try:
+            each.close()
+        except OSError:
+            pass
+
+
+def test_rows_are_written_in_chunk_size_batches(monkeypatch, logger):
+    # Keep the idle timeout out of the way so only full batches and flush() write.
+    monkeypatch.setattr(data_logger, "FLUSH_SECONDS", 60)
+    log = logger(chunkSize=4)
+    recorder = RecordingWriter(log._writer)
+    log._writer = recorder
+
+    for index in range(10):
+        log.appendRound(_row(index))
+    log.flush()
+
+    assert recorder.batchSizes == [4, 4, 2]
+    assert _read_rows(log) == [list(ROUND_COLUMNS)] + [_row(index) for index in range(10)]
+
+
+def test_partial_batch_is_written_once_idle(logger):
+    log = logger(chunkSize=64)
+    for index in range(3):
+        log.appendRound(_row(index))
+
+    # No flush() call: the writer thread writes the 3 rows on its own after FLUSH_SECONDS.
+    deadline = time.monotonic() + 5
+    while len(_read_rows(log)) < 4 and time.monotonic() < deadline:
+        time.sleep(data_logger.FLUSH_SECONDS)
+    assert _read_rows(log)[1:] == [_row(index) for index in range(3)]
+
+
+def test_dict_rows_fill_missing_columns_with_blanks(logger):
+    log = logger()
+    log.appendRound({"Player Hand": "A of Spades, K of Spades", "Winner": "Player"})
+    log.flush()
+    row = dict(zip(ROUND_COLUMNS, _read_rows(log)[1]))
+    assert row["Player Hand"] == "A of Spades, K of Spades"
+    assert row["Winner"] == "Player"
+    assert row["Bot Hand"] == ""
+
+
+def test_writer_failure_is_raised_on_flush_and_next_append(logger):
+    log = logger()
+    log._writer = FailingWriter()
+    log.appendRound(_row(0))
+
+    with pytest.raises(OSError) as raised:
+        log.flush()
+    assert str(raised.value.__cause__) == "disk full"
+    with pytest.raises(OSError):
+        log.appendRound(_row(1))
+    with pytest.raises(OSError):
+        log.close()
+
+
+def test_close_unregisters_exit_hook(monkeypatch, logger):
+    hooks = []
+    monkeypatch.setattr(atexit, "register", hooks.append)
+    monkeypatch.setattr(atexit, "unregister", hooks.remove)
+
+    log = logger()
+    assert log.close in hooks
+    log.appendRound(_row(0))
+    log.close()
+    assert log.close not in hooks
+    assert _read_rows(log) == [list(ROUND_COLUMNS), _row(0)]
+    # A second close() is a no-op.
+    log.close()
@@ -0,0 +1,102 @@
+"""
+File: test_deck.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: Tests for cardDeck's top-of-deck pointer, board dealing and seeded shuffles.
+"""
+
+import pytest
+
+from deck import cardDeck, emptyDeckError
+
+
+def test_draw_and_burn_move_top_down():
+    deck = cardDeck(0)
+    deck.reset()
+    assert len(deck) == 52
+
+    top = deck.cards[51]
+    assert deck.draw() is top
+    pair = deck.draw(2)
+    assert pair == deck.cards[49:51]
+    deck.burn()
+    assert len(deck) == 48
+    # Drawn and burned cards stay in self.cards, above the pointer.
+    assert len(deck.cards) == 52
+
+
+def test_draw_past_the_bottom_raises():
+    deck = cardDeck(0)
+    deck.draw(50)
+    with pytest.raises(emptyDeckError):
+        deck.draw(3)
+    with pytest.raises(emptyDeckError):
+        deck.burn(3)
+    assert len(deck) == 2
+
+
+def test_reset_refills_to_52():
+    deck = cardDeck(0)
+    deck.reset()
+    deck.draw(2)
+    deck.burn()
+    deck.draw(30)
+    deck.reset()
+    assert len(deck) == 52
+    assert len({card.code for card in deck.cards}) == 52
+
+
+def test_deal_board_matches_street_by_street():
+    streets = cardDeck(5)
+    streets.reset()
+    board = cardDeck(5)
+    board.reset()
+    for deck in (streets, board):
+        deck.draw(2)
+        deck.draw(2)
+
+    streets.burn()
+    dealt = streets.draw(3)
+    for _ in range(2):
+        streets.burn()
+        dealt.append(streets.draw())
+
+    assert board.dealBoard() == dealt
+    assert len(board) == len(streets) == 52 - 4 - 8
+
+
+@pytest.mark.parametrize("k", [1, 2, 7, 52])
+def test_sample_never_repeats_and_moves_top(k):
+    deck = cardDeck(3)
+    deck.reset()
+    if k < 52:
+        deck.draw(3)
+    before = len(deck)
+    sampled = deck.sample(k)
+    assert len(sampled) == k
+    assert len({card.code for card in sampled}) == k
+    assert len(deck) == before - k
+    # Sampled cards are no longer among the cards still in the deck.
+    assert not {card.code for card in sampled} & {card.code for card in deck.cards[:deck.top]}
+
+
+def test_seeded_decks_replay_the_same_order():
+    first = cardDeck(42)
+    second = cardDeck(42)
+    for _ in range(3):
+        first.reset()
+        second.reset()
+        assert first.cards == second.cards
+        assert first.sample(5) == second.sample(5)
+        first.shuffle()
+        second.shuffle()
+        assert first.cards[:first.top] == second.cards[:second.top]
+
+
+def test_reset_shuffles_the_same_list_in_place():
+    deck = cardDeck(1)
+    cards = deck.cards
+    for _ in range(3):
+        deck.draw(5)
+        deck.reset()
+        assert deck.cards is cards
@@ -0,0 +1,153 @@
+"""
+File: test_hand_evaluator.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: Checks the Cactus Kev lookup evaluators (Python tables, the optional C
+             extension and the Numba rollout) against brute force and known hands.
+"""
+
+from itertools import combinations
+import random
+
+import pytest
+
+from _eval_jit import mcEquity
+from deck import BIT_CODES, CARD_INTS, playingCard
+from hand_evaluator import (
+   HAND_CATEGORY, HAND_HIGH,
+   _evaluatePreflop, _rank5, evaluate7Codes, evaluateCodes, evaluateHand,
+)
+from ml.predict_win_rate import handScore, predictWinRatePair
+
+
+def _cards(*names: str) -> list:
+   """Build cards from "rank suit" names, e.g. _cards("A Hearts", "10 Spades")."""
+   return [playingCard.fromStr(*name.split()) for name in names]
+
+
+def test_known_five_card_hands():
+   # The second value is the highest card in the hand, not the rank of the made hand.
+   assert evaluateHand(_cards("A Spades", "K Spades", "Q Spades", "J Spades", "10 Spades")) == (9, 14)
+   assert evaluateHand(_cards("9 Hearts", "8 Hearts", "7 Hearts", "6 Hearts", "5 Hearts")) == (8, 9)
+   assert evaluateHand(_cards("Q Clubs", "Q Hearts", "Q Spades", "Q Diamonds", "2 Clubs")) == (7, 12)
+   assert evaluateHand(_cards("3 Clubs", "3 Hearts", "3 Spades", "K Diamonds", "K Clubs")) == (6, 13)
+   assert evaluateHand(_cards("7 Clubs", "7 Hearts", "9 Spades", "J Diamonds", "2 Clubs")) == (1, 11)
+   assert evaluateHand(_cards("K Clubs", "J Hearts", "9 Spades", "5 Diamonds", "2 Clubs")) == (0, 13)
+
+
+def test_wheel_is_the_lowest_straight():
+   wheel = evaluateHand(_cards("A Spades", "2 Hearts", "3 Clubs", "4 Diamonds", "5 Spades"))
+   sixHigh = evaluateHand(_cards("2 Spades", "3 Hearts", "4 Clubs", "5 Diamonds", "6 Spades"))
+   assert wheel == (4, 5)
+   assert wheel < sixHigh
+
+   steelWheel = evaluateHand(_cards("A Hearts", "2 Hearts", "3 Hearts", "4 Hearts", "5 Hearts"))
+   assert steelWheel == (8, 5)
+
+
+
+@pytest.mark.parametrize("names", [
+   ("A Spades", "2 Hearts", "3 Clubs", "4 Diamonds", "5 Spades"),  # wheel
+   ("K Hearts", "9 Hearts", "7 Hearts", "4 Hearts", "2 Hearts"),  # flush
+   ("3 Clubs", "3 Hearts", "3 Spades", "K Diamonds", "K Clubs"),  # full house
+   ("7 Clubs", "7 Hearts", "9 Spades", "J Diamonds", "2 Clubs"),  # one pair
+   ("Q Spades", "Q Hearts"),  # preflop pair
+   ("A Spades", "K Hearts", "Q Clubs", "J Diamonds", "9 Spades", "2 Hearts"),  # six cards
+])
+def test_tuple_and_list_hands_score_the_same(names):
+   cards = _cards(*names)
+   assert evaluateHand(tuple(cards)) == evaluateHand(list(cards))
+
+
+def test_preflop_hands_score_as_pair_or_high_card():
+   deck = [playingCard.fromStr(rank, suit) for (rank, suit) in CARD_INTS]
+   for card1, card2 in combinations(deck, 2):
+      expected = (1, card1.rank) if card1.rank == card2.rank else (0, max(card1.rank, card2.rank))
+      assert _evaluatePreflop(card1.code, card2.code) == expected
+      assert evaluateHand([card1, card2]) == evaluateCodes((card1.code, card2.code)) == expected
+
+def test_seven_card_lookup_matches_best_of_21():
+   rng = random.Random(1)
+   for _ in range(3000):
+      codes = rng.sample(BIT_CODES, rng.randint(5, 7))
+      best = min(_rank5(*subset) for subset in combinations(codes, 5))
+      assert evaluate7Codes(codes) == best
+      assert evaluateCodes(codes) == (HAND_CATEGORY[best], HAND_HIGH[best])
+
+
+def test_seven_card_lookup_on_flush_heavy_hands():
+   # Five or more cards of one suit exercise the seven-card flush table.
+   rng = random.Random(2)
+   hearts = [code for (rank, suit), code in CARD_INTS.items() if suit == "Hearts"]
+   others = [code for code in BIT_CODES if code not in hearts]
+   for _ in range(1000):
+      flushCount = rng.randint(5, 7)
+      codes = rng.sample(hearts, flushCount) + rng.sample(others, 7 - flushCount)
+      best = min(_rank5(*subset) for subset in combinations(codes, 5))
+      assert evaluate7Codes(codes) == best
+
+
+def test_hand_score_matches_evaluate_codes():
+   # Covers the C extension when it is built, and the Python fallback otherwise.
+   rng = random.Random(3)
+   for _ in range(3000):
+      indices = rng.sample(range(52), rng.randint(5, 7))
+      bits = 0
+      for index in indices:
+         bits |= 1 << index
+      assert handScore(bits) == evaluateCodes([BIT_CODES[index] for index in indices])
+
+
+def test_mc_equity_is_seeded_and_plausible():
+   aces = _cards("A Hearts", "A Spades")
+   holeBits = aces[0].bit | aces[1].bit
+   first = mcEquity(holeBits, 0, 2000, 11)
+   assert mcEquity(holeBits, 0, 2000, 11) == first
+   # Pocket aces win about 85% of the time against one random hand.
+   assert 0.80 < first < 0.90
+
+   # A made royal flush on the board with no better hand possible ties every time.
+   board = _cards("A Clubs", "K Clubs", "Q Clubs", "J Clubs", "10 Clubs")
+   boardBits = 0
+   for card in board:
+      boardBits |= card.bit
+   twos = _cards("2 Hearts", "2 Spades")
+   assert mcEquity(twos[0].bit | twos[1].bit, boardBits, 200, 5) == 0.5
+
+
+
+def _bits(*names: str) -> int:
+   """Build a 52-bit card set (playingCard.bit) from "rank suit" names."""
+   bits = 0
+   for card in _cards(*names):
+      bits |= card.bit
+   return bits
+
+
+def test_predict_win_rate_pair_is_seeded():
+   aces = _bits("A Hearts", "A Spades")
+   kings = _bits("K Hearts", "K Spades")
+   assert predictWinRatePair(aces, kings, 0, 7) == predictWinRatePair(aces, kings, 0, 7)
+
+
+_FLOP = ("2 Clubs", "7 Diamonds", "9 Hearts")
+
+
+@pytest.mark.parametrize("playerBits, botBits, boardBits", [
+   # Hole cards only, the board not OR-ed into either side.
+   (_bits("A Hearts", "A Spades"), _bits("K Hearts", "K Spades"), _bits(*_FLOP)),
+   # Three hole cards for the player.
+   (_bits("A Hearts", "A Spades", "A Clubs"), _bits("K Hearts", "K Spades"), 0),
+   # One hole card for the bot.
+   (_bits("A Hearts", "A Spades", *_FLOP), _bits("K Hearts", *_FLOP), _bits(*_FLOP)),
+   # A six-card board.
+   (
+      _bits("A Hearts", "A Spades", *_FLOP, "J Clubs", "Q Clubs", "K Clubs"),
+      _bits("K Hearts", "K Spades", *_FLOP, "J Clubs", "Q Clubs", "K Clubs"),
+      _bits(*_FLOP, "J Clubs", "Q Clubs", "K Clubs"),
+   ),
+])
+def test_predict_win_rate_pair_rejects_bad_card_counts(playerBits, botBits, boardBits):
+   # mcEquity fills fixed-size buffers without bounds checks, so the counts are checked first.
+   with pytest.raises(ValueError):
+      predictWinRatePair(playerBits, botBits, boardBits)
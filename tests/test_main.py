@@ -0,0 +1,94 @@
+"""
+File: test_main.py
+Author: Jacob Silva
+Created: 10/15/2026
+Description: Tests for the logging-session prompt in main.main() and seeded rounds.
+"""
+
+import builtins
+
+import pytest
+
+from deck import cardDeck
+import main
+
+
+def _run_main_until_first_round(monkeypatch, tmp_path, answer: str):
+    """
+    Run main() with `answer` typed at every prompt, stopping before the first hand is
+    played, and return the PokerDataLogger it created.
+    """
+    monkeypatch.chdir(tmp_path)  # a logging session writes under ./data
+    monkeypatch.setattr(builtins, "input", lambda prompt="": answer)
+    monkeypatch.setattr(main, "FAST_MODE", False)
+    monkeypatch.setattr(main, "predictWinRatePair", lambda *args, **kwargs: (0.5, 0.5))
+
+    def stopBeforeFirstRound(**kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(main, "play_round", stopBeforeFirstRound)
+
+    created = []
+
+    class RecordingLogger(main.PokerDataLogger):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(main, "PokerDataLogger", RecordingLogger)
+    main.main()
+    (logger,) = created
+    return logger
+
+
+@pytest.mark.parametrize("answer", ["y", "Y", " yes "])
+def test_yes_starts_logging_session(monkeypatch, tmp_path, answer):
+    logger = _run_main_until_first_round(monkeypatch, tmp_path, answer)
+    try:
+        assert logger.enableLogging is True
+        assert (tmp_path / logger.filePath).is_file()
+    finally:
+        logger.close()
+
+
+@pytest.mark.parametrize("answer", ["", "n", "no"])
+def test_other_answers_leave_logging_off(monkeypatch, tmp_path, answer):
+    logger = _run_main_until_first_round(monkeypatch, tmp_path, answer)
+    assert logger.enableLogging is False
+    assert logger.filePath is None
+
+
+def _play_quiet_round(monkeypatch, tmp_path, **kwargs):
+    """Play one round with the player always calling and no output or hands.csv."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "VERBOSE", False)
+    monkeypatch.setattr(main, "FAST_MODE", False)
+    monkeypatch.setattr(main, "getPlayerAction", lambda: ("CALL", 0))
+    monkeypatch.setattr(main, "logGameResult", lambda *args, **kwargs: None)
+    return main.play_round(1000, 1000, True, **kwargs)
+
+
+def test_seeded_round_replays(monkeypatch, tmp_path):
+    first = _play_quiet_round(monkeypatch, tmp_path, seed=99)
+    assert _play_quiet_round(monkeypatch, tmp_path, seed=99) == first
+
+
+def test_seeded_round_leaves_session_deck_alone(monkeypatch, tmp_path):
+    sessionDeck = cardDeck(1)
+    untouched = cardDeck(1)
+    _play_quiet_round(monkeypatch, tmp_path, deck=sessionDeck, seed=99)
+
+    # Later unseeded rounds keep following the session deck's own shuffle stream.
+    for _ in range(3):
+        sessionDeck.reset()
+        untouched.reset()
+        assert sessionDeck.cards == untouched.cards
+
+
+@pytest.mark.parametrize("seed", [0, 1, 12345])
+def test_headless_round_is_a_reproducible_round_row(seed):
+    row = main.play_round_headless(seed)
+    assert tuple(row) == main.ROUND_COLUMNS
+    assert row["Winner"] in ("Player", "Bot", "Tie")
+    assert row["Player Balance"] == ""
+    assert main.play_round_headless(seed) == row